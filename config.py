@@ -4,7 +4,8 @@ from pathlib import Path
 # 基礎配置
 BASE_DIR = Path(__file__).parent
 DATA_DIR = BASE_DIR / 'data'
-ASSETS_DIR = BASE_DIR / 'assets'
+STATIC_DIR = BASE_DIR / 'static'
+ASSETS_DIR = STATIC_DIR / 'assets'
 
 # 頁面配置
 PAGE_CONFIG = {
@@ -16,12 +17,47 @@ PAGE_CONFIG = {
 
 # 數據庫配置
 DB_CONFIG = {
-    "visitor_data_path": BASE_DIR / "visitor_data.json"
+    # 訪問統計後端：sqlite（WAL，第一次使用時從 visitor_data.json 匯入）或 json
+    "backend": os.getenv("VISITOR_BACKEND", "sqlite"),
+    "sqlite_path": BASE_DIR / "visitor_data.db",
+    "visitor_data_path": BASE_DIR / "visitor_data.json",
+    # 每次訪問只追加一行到事件日誌，累積到一定數量或時間後再併入 visitor_data.json
+    "visit_log_path": BASE_DIR / "visit_events.log",
+    "compact_max_events": 500,
+    "compact_interval": 300,  # 秒
+    # 訪問先累計在記憶體中，每 flush_interval 秒或 flush_max_visits 次訪問批次寫入（結束時也會寫入）
+    "buffered": True,
+    "flush_interval": 10,  # 秒
+    "flush_max_visits": 100,
+    # 部署在幾層反向代理之後（用來從 X-Forwarded-For 右邊取得真實 IP；0 為忽略轉發標頭）
+    "trusted_proxies": int(os.getenv("TRUSTED_PROXIES", "1"))
+}
+
+# IP 資訊補充（在背景佇列中執行，不會阻塞頁面渲染）
+GEO_CONFIG = {
+    # ip-api 批次端點，每次最多 100 個 IP，多個批次由執行緒池並行送出
+    "batch_url": "http://ip-api.com/batch?fields=status,message,country,city,org,query",
+    "batch_size": 100,
+    "max_workers": 4,
+    "timeout": 3,  # 秒
+    # ip-api 批次端點每分鐘最多 15 次請求，依回應的 X-Rl / X-Ttl 節流；等待超過 max_wait 秒的批次留待下次查詢
+    "rate_limit": 15,
+    "rate_window": 60,  # 秒
+    "max_wait": 120,  # 秒
+    "queue_size": 1000,
+    # 查詢結果的持久化快取（LRU + TTL）
+    "cache_path": BASE_DIR / "geo_cache.json",
+    "cache_ttl": 7 * 24 * 3600,  # 秒
+    "cache_max_entries": 10000,
+    # 離線 CIDR 對照表（CSV：cidr,country,city,org），存在時優先使用；GEO_ONLINE=0 時不連網查詢
+    "cidr_table_path": Path(os.getenv("GEO_CIDR_TABLE", DATA_DIR / "ip_cidr.csv")),
+    "online": os.getenv("GEO_ONLINE", "1") == "1"
 }
 
 # 圖表配置
 CHART_CONFIG = {
     "template": "plotly_white",
+    "figure_cache_size": 64,
     "font_family": ["Microsoft YaHei", "SimHei", "Arial Unicode MS"]
 }
 
@@ -38,5 +74,57 @@ MODEL_CONFIG = {
     "gas_data_path": DATA_DIR / "gas_data.csv",
     "model_path": DATA_DIR / "gas_model.pkl",
     "prediction_hours": 24,
-    "training_window": 168  # 7天
+    "training_window": 168,  # 7天
+    # 訓練時先以視窗最後幾小時之外的數據試擬合，量測各氣體的預測準確率，再以整個視窗訓練正式模型（0 為不量測）
+    "holdout_hours": 24,
+    # 並行訓練的 worker 數（-1 為全部核心），先分給各氣體，剩餘核心再分給各模型的決策樹
+    "n_jobs": int(os.getenv("GAS_MODEL_JOBS", "-1")),
+    # 隨機森林訓練會釋放 GIL，使用執行緒即可避免在行程間複製資料
+    "parallel_backend": os.getenv("GAS_MODEL_BACKEND", "threading"),
+    # 所有氣體共用同一組特徵，開啟後以單一多輸出模型同時預測所有氣體
+    "multi_output": False,
+    # 增量更新：每次以新樹替換最舊的樹數；視窗平均偏移超過此倍數的標準差時改為完整重訓
+    "refresh_trees": 10,
+    "drift_threshold": 1.0,
+    # 多機台：每台機台一份模型存檔，記憶體中只保留最近使用、總大小不超過預算的模型
+    "fleet_model_dir": DATA_DIR / "models",
+    "fleet_memory_mb": 512,
+    "fleet_multi_output": True
+}
+
+# 靜態資源配置（內容雜湊定址的圖片庫）
+ASSET_CONFIG = {
+    "objects_dir": ASSETS_DIR / "objects",
+    "manifest_path": ASSETS_DIR / "manifest.json",
+    "url_prefix": "app/static/assets/objects",
+    # 縮圖變體：依頁面顯示尺寸（px）產生，scale 為高解析度螢幕倍率
+    "variants_dir": ASSETS_DIR / "variants",
+    "variant_url_prefix": "app/static/assets/variants",
+    "variant_sizes": [60, 70, 80, 120],
+    "variant_scale": 2,
+    "variant_format": "webp",
+    # 執行期圖片快取上限（所有 session 共用）
+    "registry_cache_bytes": 4 * 1024 * 1024,
+    # static：以靜態網址提供（瀏覽器可快取）；inline：內嵌 data URI
+    "serve_mode": os.getenv("ASSET_SERVE_MODE", "static")
+}
+
+# Mermaid 圖表預先渲染配置（需安裝 @mermaid-js/mermaid-cli）
+DIAGRAM_CONFIG = {
+    "cache_dir": BASE_DIR / "diagrams",
+    # 也可指向參數相同的 mermaidx；diagrams/ 中的 SVG 由
+    # `MMDC_PATH=mermaidx python -m utils.diagram_cache`（mermaidx 0.9.5，Mermaid 11.16.0）產生
+    "mmdc_path": os.getenv("MMDC_PATH", "mmdc"),
+    "render_timeout": 60
+}
+
+# 各頁面用到的圖片（鍵值, 顯示尺寸 px），供 image_registry.prefetch 預先準備
+PAGE_ASSETS = {
+    "projects": [
+        ("slide2_img4", 120), ("slide4_img3", 120),
+        ("slide1_img1", 70), ("slide1_img6", 70), ("slide1_img3", 70),
+        ("slide1_img4", 70), ("slide1_img2", 70),
+        ("slide2_img4", 80), ("slide4_img3", 80),
+        ("slide2_img4", 60), ("slide4_img3", 60)
+    ]
 }
@@ -0,0 +1,48 @@
+import numpy as np
+
+
+class StreamingAnomalyDetector:
+    # 以 Welford 算法同时维护所有气体的运行均值与方差，批量或逐笔更新
+    def __init__(self, columns, threshold=3):
+        self.columns = list(columns)
+        self.threshold = threshold
+        self.count = 0
+        self.mean = np.zeros(len(self.columns))
+        self.m2 = np.zeros(len(self.columns))
+
+    @property
+    def std(self):
+        # 与 pandas 的 std() 相同，使用样本标准差
+        if self.count < 2:
+            return np.zeros(len(self.columns))
+        return np.sqrt(self.m2 / (self.count - 1))
+
+    def partial_fit(self, X):
+        # 一次合并整批数据的统计量（Chan 等人的并行合并公式）
+        X = np.asarray(X, dtype=np.float64).reshape(-1, len(self.columns))
+        n = len(X)
+        if n == 0:
+            return self
+        batch_mean = X.mean(axis=0)
+        batch_m2 = ((X - batch_mean) ** 2).sum(axis=0)
+        total = self.count + n
+        delta = batch_mean - self.mean
+        self.mean = self.mean + delta * n / total
+        self.m2 = self.m2 + batch_m2 + delta ** 2 * self.count * n / total
+        self.count = total
+        return self
+
+    def predict(self, X):
+        # 返回 (样本数, 气体数) 的布尔遮罩，偏离均值超过 threshold 个标准差即为异常
+        X = np.asarray(X, dtype=np.float64).reshape(-1, len(self.columns))
+        return np.abs(X - self.mean) > self.threshold * self.std
+
+    def update(self, x):
+        # 逐笔：先以目前的统计量判断，再把这笔数据并入，O(气体数)
+        x = np.asarray(x, dtype=np.float64)
+        flags = self.predict(x)[0]
+        self.count += 1
+        delta = x - self.mean
+        self.mean = self.mean + delta / self.count
+        self.m2 = self.m2 + delta * (x - self.mean)
+        return flags
@@ -0,0 +1,208 @@
+import argparse
+import json
+import os
+import pickle
+import platform
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import numpy as np
+import sklearn
+
+from config import DATA_DIR
+from gas_monitoring import GasMonitoring
+
+# 默认测试范围：1 周到 1 年的每小时数据、5 到 500 个气体通道
+SUITE_DAYS = [7, 30, 90, 365]
+SUITE_GASES = [5, 50, 500]
+
+
+def default_worker_counts():
+    # 1, 2, 4, ... 直到全部核心
+    cpus = os.cpu_count() or 1
+    counts = []
+    n = 1
+    while n < cpus:
+        counts.append(n)
+        n *= 2
+    counts.append(cpus)
+    return counts
+
+
+def bench_training(worker_counts, repeat=3, backend=None):
+    results = []
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        for workers in worker_counts:
+            gm = GasMonitoring(model_path=Path(tmp_dir) / 'gas_model.pkl', warm_start=False, n_jobs=workers)
+            if backend:
+                gm.parallel_backend = backend
+            data = gm.generate_data()
+            timings = []
+            for _ in range(repeat):
+                start = time.perf_counter()
+                gm.train_models(data, force=True)
+                timings.append(time.perf_counter() - start)
+            results.append({'workers': workers, 'seconds': min(timings)})
+
+    baseline = results[0]['seconds']
+    for result in results:
+        result['speedup'] = baseline / result['seconds']
+    return results
+
+
+def compare_modes(holdout_hours=24, repeat=3):
+    # 同一份数据分别以逐气体模型与多输出模型训练，在最后 holdout_hours 小时上比较
+    results = []
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        data = GasMonitoring(model_path=Path(tmp_dir) / 'unused.pkl', warm_start=False).generate_data()
+        train, holdout = data.iloc[:-holdout_hours].copy(), data.iloc[-holdout_hours:]
+        for multi_output in (False, True):
+            gm = GasMonitoring(model_path=Path(tmp_dir) / f'gas_model_{multi_output}.pkl',
+                               warm_start=False, multi_output=multi_output)
+            start = time.perf_counter()
+            gm.train_models(train, force=True)
+            train_seconds = time.perf_counter() - start
+
+            timings = []
+            for _ in range(repeat):
+                start = time.perf_counter()
+                gm.predict_future()
+                timings.append(time.perf_counter() - start)
+
+            results.append({
+                'mode': 'multi-output' if multi_output else 'per-gas',
+                'train_seconds': train_seconds,
+                'predict_ms': min(timings) * 1000,
+                'model_kb': len(pickle.dumps((gm.models, gm.scalers))) / 1024,
+                'accuracy': gm.evaluate(holdout)
+            })
+    return results
+
+
+def make_base_flow(n_gases):
+    # 前 5 个沿用默认气体，更多通道依序重复默认基准流量
+    defaults = GasMonitoring(warm_start=False, persist=False).base_flow
+    if n_gases <= len(defaults):
+        return dict(list(defaults.items())[:n_gases])
+    flows = list(defaults.values())
+    return {f'CH{i:03d}': flows[i % len(flows)] for i in range(n_gases)}
+
+
+def measure(func, track_memory=True):
+    # 返回 (结果, 秒数, 峰值内存 MB)；计时与内存分两次执行，tracemalloc 的开销不会算进耗时
+    start = time.perf_counter()
+    result = func()
+    seconds = time.perf_counter() - start
+    if not track_memory:
+        return result, seconds, None
+
+    # 每个阶段单独追踪本阶段配置的内存峰值，与阶段顺序和分配器是否重用内存无关；
+    # tracemalloc 只统计经由 Python/numpy 配置的内存，sklearn 在 C 层的树节点不在其中
+    tracemalloc.start()
+    try:
+        func()
+        peak_mb = tracemalloc.get_traced_memory()[1] / 1024 / 1024
+    finally:
+        tracemalloc.stop()
+    return result, seconds, peak_mb
+
+
+def run_suite(days_list=None, gases_list=None, multi_output=False, track_memory=True):
+    results = []
+    end_date = datetime(2025, 1, 1)
+    for n_gases in gases_list or SUITE_GASES:
+        for days in days_list or SUITE_DAYS:
+            gm = GasMonitoring(warm_start=False, multi_output=multi_output, persist=False)
+            gm.base_flow = make_base_flow(n_gases)
+            # 训练窗口涵盖全部数据，训练量才会随天数增长（默认只取最后 training_window 小时）
+            stages = [
+                ('generate_data', lambda: gm.generate_data(end_date - timedelta(days=days), end_date, seed=0)),
+                ('train_models', lambda: gm.train_models(data, force=True)),
+                ('predict_future', lambda: gm.predict_future()),
+                ('detect_anomalies', lambda: gm.detect_anomalies(data))
+            ]
+            data = None
+            for stage, func in stages:
+                result, seconds, peak_mb = measure(func, track_memory)
+                if stage == 'generate_data':
+                    data = result
+                    gm.training_window = len(data)
+                results.append({
+                    'stage': stage,
+                    'days': days,
+                    'gases': n_gases,
+                    'rows': len(data),
+                    'seconds': seconds,
+                    'peak_mb': peak_mb
+                })
+                print(f"{stage:>16} {days:>4}d {n_gases:>4} gases {seconds:>9.3f}s"
+                      + (f" {peak_mb:>9.1f} MB" if peak_mb is not None else ""))
+    return results
+
+
+def compare_with_baseline(results, baseline_path):
+    # 与之前的结果比较，列出每项的耗时比值（>1 表示变慢）
+    baseline = json.loads(Path(baseline_path).read_text(encoding='utf-8'))
+    previous = {(r['stage'], r['days'], r['gases']): r['seconds'] for r in baseline['results']}
+    for result in results:
+        key = (result['stage'], result['days'], result['gases'])
+        if key in previous and previous[key] > 0:
+            ratio = result['seconds'] / previous[key]
+            flag = "  <-- 变慢" if ratio > 1.2 else ""
+            print(f"{key[0]:>16} {key[1]:>4}d {key[2]:>4} gases {ratio:>6.2f}x{flag}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="GasMonitoring 训练与预测的性能测试")
+    parser.add_argument("--workers", type=int, nargs="*", help="要测试的 worker 数（默认 1 到全部核心）")
+    parser.add_argument("--repeat", type=int, default=3, help="每种配置重复次数，取最快一次")
+    parser.add_argument("--backend", choices=["threading", "loky"], help="joblib 并行后端")
+    parser.add_argument("--compare-modes", action="store_true", help="比较逐气体模型与多输出模型")
+    parser.add_argument("--suite", action="store_true", help="在不同数据量与气体数下测试整个流程并输出 JSON")
+    parser.add_argument("--days", type=int, nargs="*", help=f"数据天数（默认 {SUITE_DAYS}）")
+    parser.add_argument("--gases", type=int, nargs="*", help=f"气体通道数（默认 {SUITE_GASES}）")
+    parser.add_argument("--multi-output", action="store_true", help="以多输出模型测试")
+    parser.add_argument("--no-memory", action="store_true", help="不统计峰值内存（每个阶段少执行一次）")
+    parser.add_argument("--output", default=str(DATA_DIR / "gas_benchmark.json"), help="JSON 结果路径")
+    parser.add_argument("--baseline", help="与之前的 JSON 结果比较")
+    args = parser.parse_args(argv)
+
+    if args.suite:
+        results = run_suite(args.days, args.gases, args.multi_output, not args.no_memory)
+        report = {
+            'created_at': datetime.now().isoformat(),
+            'python': platform.python_version(),
+            'numpy': np.__version__,
+            'sklearn': sklearn.__version__,
+            'cpu_count': os.cpu_count(),
+            'multi_output': args.multi_output,
+            'results': results
+        }
+        output = Path(args.output)
+        output.parent.mkdir(parents=True, exist_ok=True)
+        output.write_text(json.dumps(report, indent=2, ensure_ascii=False), encoding='utf-8')
+        print(f"结果已写入 {output}")
+        if args.baseline:
+            compare_with_baseline(results, args.baseline)
+        return
+
+    if args.compare_modes:
+        results = compare_modes(repeat=args.repeat)
+        gases = list(results[0]['accuracy'])
+        print(f"{'mode':>14} {'train s':>8} {'predict ms':>11} {'model KB':>9} " + " ".join(f"{gas:>9}" for gas in gases))
+        for result in results:
+            print(f"{result['mode']:>14} {result['train_seconds']:>8.3f} {result['predict_ms']:>11.2f} "
+                  f"{result['model_kb']:>9.0f} " + " ".join(f"{result['accuracy'][gas]:>8.2f}%" for gas in gases))
+        return
+
+    results = bench_training(args.workers or default_worker_counts(), args.repeat, args.backend)
+    print(f"{'workers':>8} {'seconds':>10} {'speedup':>8}")
+    for result in results:
+        print(f"{result['workers']:>8} {result['seconds']:>10.3f} {result['speedup']:>7.2f}x")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,102 @@
+import threading
+from collections import OrderedDict
+from datetime import datetime
+from pathlib import Path
+
+from joblib import Parallel, delayed, effective_n_jobs
+
+from config import MODEL_CONFIG
+from gas_monitoring import GasMonitoring
+
+
+def _train_shard(tool_id, base_flow, data, model_path, multi_output, force):
+    # 在子进程中训练一台机台并写入存档，只把结果摘要传回主进程
+    gm = GasMonitoring(model_path=model_path, n_jobs=1, multi_output=multi_output, base_flow=base_flow)
+    trained = gm.train_models(data, force=force)
+    return tool_id, trained
+
+
+class GasFleet:
+    # 多机台 / 多腔体管理：每台机台一份模型存档，内存中以 LRU 保留不超过预算的模型
+    def __init__(self, tools, model_dir=None, memory_budget_mb=None, n_jobs=None, multi_output=None):
+        self.tools = dict(tools)  # 机台 ID -> base_flow
+        self.model_dir = Path(model_dir or MODEL_CONFIG["fleet_model_dir"])
+        self.memory_budget = (memory_budget_mb or MODEL_CONFIG["fleet_memory_mb"]) * 1024 * 1024
+        self.n_jobs = MODEL_CONFIG["n_jobs"] if n_jobs is None else n_jobs
+        self.multi_output = MODEL_CONFIG["fleet_multi_output"] if multi_output is None else multi_output
+        self.shards = OrderedDict()  # 机台 ID -> (GasMonitoring, 估计大小)
+        self.memory_used = 0
+        self.evictions = 0
+        self._lock = threading.Lock()
+
+    def model_path(self, tool_id):
+        return self.model_dir / f"{tool_id}.pkl"
+
+    def _model_bytes(self, tool_id):
+        # 以存档大小估计模型在内存中的大小
+        path = self.model_path(tool_id)
+        return path.stat().st_size if path.exists() else 0
+
+    def get(self, tool_id):
+        # 取得机台的 GasMonitoring；不在内存中时从存档载入，必要时淘汰最久未使用的机台
+        with self._lock:
+            if tool_id in self.shards:
+                self.shards.move_to_end(tool_id)
+                return self.shards[tool_id][0]
+
+        gm = GasMonitoring(model_path=self.model_path(tool_id), multi_output=self.multi_output,
+                           base_flow=self.tools[tool_id])
+        size = self._model_bytes(tool_id)
+        with self._lock:
+            if tool_id in self.shards:
+                return self.shards[tool_id][0]
+            self.shards[tool_id] = (gm, size)
+            self.memory_used += size
+            # 至少保留刚载入的机台
+            while self.memory_used > self.memory_budget and len(self.shards) > 1:
+                _, (_, evicted_size) = self.shards.popitem(last=False)
+                self.memory_used -= evicted_size
+                self.evictions += 1
+        return gm
+
+    def _discard(self, tool_id):
+        with self._lock:
+            if tool_id in self.shards:
+                _, size = self.shards.pop(tool_id)
+                self.memory_used -= size
+
+    def train(self, data_by_tool, force=False):
+        # 各机台在不同进程中并行训练；训练过的机台下次 get() 时重新载入新存档
+        self.model_dir.mkdir(parents=True, exist_ok=True)
+        results = Parallel(n_jobs=self.n_jobs, backend='loky')(
+            delayed(_train_shard)(tool_id, self.tools[tool_id], data, self.model_path(tool_id),
+                                  self.multi_output, force)
+            for tool_id, data in data_by_tool.items()
+        )
+        for tool_id, trained in results:
+            if trained:
+                self._discard(tool_id)
+        return dict(results)
+
+    def _predict_tool(self, tool_id, start, hours):
+        return tool_id, self.get(tool_id).predict_batch([start], hours).drop(columns=['start', 'horizon'])
+
+    def predict(self, tool_ids=None, hours=24):
+        # 返回 {机台 ID: 预测 DataFrame}；各机台经 get() 取得模型，不在内存中的机台载入后留在 LRU 中，
+        # 下次预测直接使用；多核时以线程并行，模型不必在进程间复制
+        tool_ids = list(tool_ids or self.tools)
+        start = datetime.now()
+        results = Parallel(n_jobs=min(effective_n_jobs(self.n_jobs), len(tool_ids) or 1), prefer='threads')(
+            delayed(self._predict_tool)(tool_id, start, hours) for tool_id in tool_ids
+        )
+        return dict(results)
+
+    def stats(self):
+        with self._lock:
+            return {
+                'tools': len(self.tools),
+                'loaded': len(self.shards),
+                'memory_used_mb': self.memory_used / 1024 / 1024,
+                'memory_budget_mb': self.memory_budget / 1024 / 1024,
+                'evictions': self.evictions
+            }
@@ -0,0 +1,124 @@
+import csv
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.csv as pacsv
+import pyarrow.parquet as pq
+
+from config import MODEL_CONFIG
+
+
+def time_features(timestamps):
+    # 与 GasMonitoring.features 相同顺序：hour, day_of_week, month
+    timestamps = pd.DatetimeIndex(timestamps)
+    return np.column_stack([timestamps.hour, timestamps.dayofweek, timestamps.month])
+
+
+def iter_batches(path, block_size=1 << 20, batch_rows=65536):
+    # 逐块读取气体记录（CSV 按字节块、Parquet 按行组），不会一次载入整个文件
+    path = Path(path)
+    if path.suffix == '.parquet':
+        yield from pq.ParquetFile(path).iter_batches(batch_size=batch_rows)
+        return
+    # open_csv 只按第一个块推断类型，前面全是整数的流量列到后面遇到小数会转换失败，先读表头固定各列类型
+    with open(path, newline='', encoding='utf-8') as f:
+        header = next(csv.reader(f), [])
+    column_types = {column: pa.float64() for column in header if column.endswith('_flow')}
+    column_types['timestamp'] = pa.timestamp('ns')
+    reader = pacsv.open_csv(
+        path,
+        read_options=pacsv.ReadOptions(block_size=block_size),
+        convert_options=pacsv.ConvertOptions(column_types=column_types)
+    )
+    for batch in reader:
+        yield batch
+
+
+class GasWindowBuffer:
+    # 固定长度的环形缓冲区，只保留最近 window 小时的数据（数据需按时间排序）
+    def __init__(self, gas_columns, window=None):
+        self.window = window or MODEL_CONFIG["training_window"]
+        self.gas_columns = list(gas_columns)
+        self.timestamps = np.zeros(self.window, dtype='datetime64[ns]')
+        self.features = np.zeros((self.window, 3), dtype=np.int64)
+        self.flows = np.zeros((self.window, len(self.gas_columns)))
+        self.total = 0
+        # 窗口内各气体的累计和与平方和，进出窗口时增减即可得到均值与标准差
+        self.sum = np.zeros(len(self.gas_columns))
+        self.sumsq = np.zeros(len(self.gas_columns))
+
+    def __len__(self):
+        return min(self.total, self.window)
+
+    def append(self, timestamps, flows):
+        timestamps = np.asarray(timestamps, dtype='datetime64[ns]')
+        flows = np.asarray(flows, dtype=np.float64)
+        n = len(timestamps)
+        # 超过窗口的部分马上就会被覆盖，直接丢弃
+        if n > self.window:
+            self.total += n - self.window
+            timestamps, flows = timestamps[-self.window:], flows[-self.window:]
+            n = self.window
+
+        idx = (self.total + np.arange(n)) % self.window
+        if n == self.window:
+            self.sum = flows.sum(axis=0)
+            self.sumsq = (flows ** 2).sum(axis=0)
+        else:
+            # 减去即将被覆盖的旧数据
+            evicted = self.flows[idx[idx < len(self)]]
+            self.sum += flows.sum(axis=0) - evicted.sum(axis=0)
+            self.sumsq += (flows ** 2).sum(axis=0) - (evicted ** 2).sum(axis=0)
+        self.timestamps[idx] = timestamps
+        self.features[idx] = time_features(timestamps)
+        self.flows[idx] = flows
+        self.total += n
+
+    def mean(self):
+        return self.sum / max(len(self), 1)
+
+    def std(self):
+        n = max(len(self), 1)
+        return np.sqrt(np.maximum(self.sumsq / n - (self.sum / n) ** 2, 0))
+
+    def append_batch(self, batch):
+        # 只把批次末尾可能留在窗口内的行转成 numpy
+        skip = max(0, batch.num_rows - self.window)
+        self.total += skip
+        batch = batch.slice(skip)
+        flows = np.column_stack([batch.column(col).to_numpy(zero_copy_only=False) for col in self.gas_columns])
+        self.append(batch.column('timestamp').to_numpy(zero_copy_only=False), flows)
+
+    def _order(self):
+        # 缓冲区内按时间先后排列的位置
+        n = len(self)
+        return (self.total - n + np.arange(n)) % self.window
+
+    def snapshot(self):
+        # 按时间排序的 (时间戳, 流量)，可用 append() 还原
+        order = self._order()
+        return self.timestamps[order], self.flows[order]
+
+    def to_frame(self):
+        order = self._order()
+        data = pd.DataFrame({'timestamp': self.timestamps[order]})
+        for i, col in enumerate(self.gas_columns):
+            data[col] = self.flows[order, i]
+        for i, col in enumerate(['hour', 'day_of_week', 'month']):
+            data[col] = self.features[order, i]
+        return data
+
+
+def load_training_window(path=None, window=None, block_size=1 << 20, batch_rows=65536):
+    # 串流读取气体记录，返回可直接交给 train_models 的最近 window 小时数据
+    buffer = None
+    for batch in iter_batches(path or MODEL_CONFIG["gas_data_path"], block_size, batch_rows):
+        if buffer is None:
+            gas_columns = [col for col in batch.schema.names if col.endswith('_flow')]
+            buffer = GasWindowBuffer(gas_columns, window)
+        buffer.append_batch(batch)
+    if buffer is None:
+        return pd.DataFrame(columns=['timestamp'])
+    return buffer.to_frame()
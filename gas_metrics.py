@@ -0,0 +1,71 @@
+import functools
+import threading
+import time
+
+import numpy as np
+
+
+class LatencyHistogram:
+    # 对数分桶的延迟直方图：1 微秒到 1000 秒，每十倍 20 个桶（相对误差约 6%），内存固定
+    def __init__(self, low=1e-6, high=1e3, buckets_per_decade=20):
+        decades = int(round(np.log10(high / low)))
+        self.bounds = low * 10 ** (np.arange(decades * buckets_per_decade + 1) / buckets_per_decade)
+        self.counts = np.zeros(len(self.bounds) + 1, dtype=np.int64)
+        self.count = 0
+        self.total = 0.0
+
+    def record(self, seconds):
+        self.counts[np.searchsorted(self.bounds, seconds)] += 1
+        self.count += 1
+        self.total += seconds
+
+    def percentile(self, q):
+        if self.count == 0:
+            return None
+        bucket = int(np.searchsorted(np.cumsum(self.counts), q / 100 * self.count))
+        # 取桶上下界的几何中点
+        lower = self.bounds[max(bucket - 1, 0)]
+        upper = self.bounds[min(bucket, len(self.bounds) - 1)]
+        return float(np.sqrt(lower * upper))
+
+    def summary(self):
+        # 单位为毫秒
+        if self.count == 0:
+            return {'count': 0, 'mean': None, 'p50': None, 'p95': None, 'p99': None}
+        return {
+            'count': self.count,
+            'mean': self.total / self.count * 1000,
+            'p50': self.percentile(50) * 1000,
+            'p95': self.percentile(95) * 1000,
+            'p99': self.percentile(99) * 1000
+        }
+
+
+class LatencyRecorder:
+    def __init__(self):
+        self.histograms = {}
+        self._lock = threading.Lock()
+
+    def record(self, name, seconds):
+        with self._lock:
+            if name not in self.histograms:
+                self.histograms[name] = LatencyHistogram()
+            self.histograms[name].record(seconds)
+
+    def summary(self):
+        with self._lock:
+            return {name: hist.summary() for name, hist in self.histograms.items()}
+
+
+def timed(name):
+    # 方法装饰器：把每次调用的耗时记录到 self.latency
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(self, *args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return func(self, *args, **kwargs)
+            finally:
+                self.latency.record(name, time.perf_counter() - start)
+        return wrapper
+    return decorator
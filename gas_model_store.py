@@ -0,0 +1,64 @@
+import hashlib
+import os
+from datetime import datetime
+from pathlib import Path
+
+import joblib
+import numpy as np
+import sklearn
+
+from config import MODEL_CONFIG
+
+# 存档格式版本，改动存档内容时递增
+MODEL_VERSION = 3
+
+
+def data_fingerprint(data, columns):
+    # 以训练窗口内的特征与目标值计算指纹，数据不变则模型不必重训
+    digest = hashlib.sha256()
+    for col in columns:
+        digest.update(col.encode('utf-8'))
+        digest.update(np.ascontiguousarray(data[col].to_numpy(dtype=np.float64)).tobytes())
+    return digest.hexdigest()
+
+
+class GasModelStore:
+    def __init__(self, model_path=None):
+        self.model_path = Path(model_path or MODEL_CONFIG["model_path"])
+
+    def save(self, models, scalers, fingerprint, features, gas_columns, multi_output=False, window=None):
+        bundle = {
+            'version': MODEL_VERSION,
+            'sklearn_version': sklearn.__version__,
+            'fingerprint': fingerprint,
+            'features': list(features),
+            'gas_columns': list(gas_columns),
+            'multi_output': multi_output,
+            'trained_at': datetime.now().isoformat(),
+            'models': models,
+            'scalers': scalers,
+            # 训练窗口（时间戳、流量及训练时的统计量），重启后 update() 才能继续增量更新
+            'window': window
+        }
+        self.model_path.parent.mkdir(parents=True, exist_ok=True)
+        # 先写临时文件再替换，避免其他进程读到写了一半的存档
+        tmp_path = self.model_path.with_suffix(self.model_path.suffix + '.tmp')
+        joblib.dump(bundle, tmp_path)
+        os.replace(tmp_path, self.model_path)
+        return bundle
+
+    def load(self):
+        if not self.model_path.exists():
+            return None
+        try:
+            bundle = joblib.load(self.model_path)
+        except Exception:
+            return None
+        # 格式或 sklearn 版本不同的存档无法安全使用，视为没有存档
+        if bundle.get('version') != MODEL_VERSION or bundle.get('sklearn_version') != sklearn.__version__:
+            return None
+        return bundle
+
+    def clear(self):
+        if self.model_path.exists():
+            self.model_path.unlink()
@@ -4,28 +4,23 @@ import numpy as np
 import plotly.express as px
 import plotly.graph_objects as go
 from plotly.subplots import make_subplots
-from datetime import datetime, timedelta
-import requests
-from sklearn.cluster import KMeans
-from sklearn.ensemble import IsolationForest, RandomForestRegressor
-from sklearn.model_selection import train_test_split
-from statsmodels.tsa.seasonal import seasonal_decompose
-from streamlit_mermaid import st_mermaid
+from datetime import datetime
 import sys
 import os
 
-# 加入父目錄到 path 以導入 license_images_data
+# 加入父目錄到 path 以導入圖片資源庫
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-try:
-    from license_images_data import LICENSE_IMAGES
-except ImportError:
-    LICENSE_IMAGES = {}
-
-# 導入 LLM 圖片 base64 資料
-try:
-    from llm_images_data import LLM_IMAGES
-except ImportError:
-    LLM_IMAGES = {}
+from utils.asset_store import image_registry
+from utils.diagram_cache import render_mermaid
+from utils.figure_cache import figure_cache
+from utils.lazy_import import lazy_import, format_import_report
+
+# 機器學習套件延遲載入：只有「📈 Project Showcase」「🔬 Project Analysis」用到時才真正 import
+sk_cluster = lazy_import("sklearn.cluster")
+sk_ensemble = lazy_import("sklearn.ensemble")
+sk_model_selection = lazy_import("sklearn.model_selection")
+sk_preprocessing = lazy_import("sklearn.preprocessing")
+tsa_seasonal = lazy_import("statsmodels.tsa.seasonal")
 
 def generate_process_data(n_samples=1000):
     np.random.seed(42)
@@ -59,7 +54,7 @@ def train_anomaly_detector(data):
     X = data[['temperature', 'pressure']]
 
     # Train isolation forest
-    iso_forest = IsolationForest(contamination=0.02, random_state=42)
+    iso_forest = sk_ensemble.IsolationForest(contamination=0.02, random_state=42)
     iso_forest.fit(X)
 
     return iso_forest
@@ -70,10 +65,10 @@ def predict_quality(data):
     y = data['quality']
 
     # Split data
-    X_train, X_test, y_train, y_test = train_test_split(X, y, test_size=0.2, random_state=42)
+    X_train, X_test, y_train, y_test = sk_model_selection.train_test_split(X, y, test_size=0.2, random_state=42)
 
     # Train model
-    rf_model = RandomForestRegressor(n_estimators=100, random_state=42)
+    rf_model = sk_ensemble.RandomForestRegressor(n_estimators=100, random_state=42)
     rf_model.fit(X_train, y_train)
 
     # Make predictions
@@ -106,35 +101,11 @@ CHART_STYLE = {
 import streamlit as st
 import pandas as pd
 import numpy as np
-from PIL import Image
 import plotly.graph_objects as go
 import plotly.express as px
 from pathlib import Path
 import datetime
-import smtplib
-from email.mime.text import MIMEText
-from email.mime.multipart import MIMEMultipart
-import json
-import requests
 from datetime import datetime
-import schedule
-import threading
-from sklearn.ensemble import RandomForestRegressor
-from sklearn.preprocessing import StandardScaler
-from sklearn.decomposition import PCA
-from sklearn.cross_decomposition import PLSRegression
-from sklearn.model_selection import cross_val_predict
-from sklearn.linear_model import LinearRegression
-import matplotlib.pyplot as plt
-import matplotlib as mpl
-
-from config import (
-    PAGE_CONFIG,
-    CHART_CONFIG,
-    DB_CONFIG,
-    MAIL_CONFIG,
-    MODEL_CONFIG
-)
 
 from utils import visitor_tracker
 
@@ -146,81 +117,6 @@ st.set_page_config(
     initial_sidebar_state="collapsed"  # Collapse sidebar on mobile by default
 )
 
-# Set font configuration
-plt.rcParams['font.sans-serif'] = CHART_CONFIG["font_family"]
-plt.rcParams['axes.unicode_minus'] = False
-mpl.rcParams['font.family'] = CHART_CONFIG["font_family"]
-
-# Visitor tracking functions
-def get_visitor_ip():
-    try:
-        response = requests.get('https://api.ipify.org?format=json')
-        return response.json()['ip']
-    except:
-        return 'Unknown'
-
-def load_visitor_data():
-    try:
-        with open('visitor_data.json', 'r') as f:
-            return json.load(f)
-    except:
-        return {'total_visits': 0, 'daily_visits': {}, 'ip_records': {}}
-
-def save_visitor_data(data):
-    with open('visitor_data.json', 'w') as f:
-        json.dump(data, f)
-
-def update_visitor_count():
-    visitor_data = load_visitor_data()
-    today = datetime.now().strftime('%Y-%m-%d')
-    ip = get_visitor_ip()
-
-    visitor_data['total_visits'] += 1
-
-    if today not in visitor_data['daily_visits']:
-        visitor_data['daily_visits'][today] = 0
-    visitor_data['daily_visits'][today] += 1
-
-    if today not in visitor_data['ip_records']:
-        visitor_data['ip_records'][today] = []
-    if ip not in visitor_data['ip_records'][today]:
-        visitor_data['ip_records'][today].append(ip)
-
-    save_visitor_data(visitor_data)
-
-    current_time = datetime.now()
-    if current_time.hour == 20 and current_time.minute == 0:
-        send_daily_report(visitor_data, today)
-
-    return visitor_data['total_visits']
-
-def send_daily_report(visitor_data, today):
-    ip_locations = []
-    for ip in visitor_data['ip_records'].get(today, []):
-        try:
-            response = requests.get(f'http://ip-api.com/json/{ip}')
-            location = response.json()
-            ip_locations.append(
-                f"IP: {ip}\n"
-                f"Location: {location.get('city', 'Unknown')}, {location.get('country', 'Unknown')}\n"
-                f"Organization: {location.get('org', 'Unknown')}"
-            )
-        except:
-            ip_locations.append(f"IP: {ip}, Location: Unknown")
-
-    email_content = (
-        f"Date: {today}\n"
-        f"Today's Visits: {visitor_data['daily_visits'].get(today, 0)}\n"
-        f"Visitor IP Sources:\n"
-        f"{''.join(ip_locations)}"
-    )
-
-    msg = MIMEMultipart()
-    msg['From'] = MAIL_CONFIG['sender']
-    msg['To'] = MAIL_CONFIG['receiver']
-    msg['Subject'] = f'Resume Website Visit Report - {today}'
-    msg.attach(MIMEText(email_content, 'plain'))
-
 @st.cache_data(ttl=3600)
 def generate_gas_data():
     dates = pd.date_range(start='2023-01-01', periods=1000, freq='H')
@@ -261,10 +157,10 @@ def train_gas_model(data):
         X = data[features].values
         y = data[gas].values
 
-        scaler = StandardScaler()
+        scaler = sk_preprocessing.StandardScaler()
         X_scaled = scaler.fit_transform(X)
 
-        model = RandomForestRegressor(n_estimators=50, random_state=42)
+        model = sk_ensemble.RandomForestRegressor(n_estimators=50, random_state=42)
         model.fit(X_scaled, y)
 
         models[gas] = model
@@ -293,6 +189,22 @@ def predict_gas_flow(models, scalers, hours=24):
 
     return predictions
 
+def build_benefit_chart(benefit_data):
+    fig = go.Figure(data=[
+        go.Bar(name='Original Time (min)', x=benefit_data["Project"], y=benefit_data["Original Time"], marker_color='rgba(255, 99, 71, 0.7)'),
+        go.Bar(name='Optimized Time (min)', x=benefit_data["Project"], y=benefit_data["Optimized Time"], marker_color='rgba(60, 179, 113, 0.7)')
+    ])
+    
+    fig.update_layout(
+        title='LLM Project Efficiency Comparison',
+        barmode='group',
+        title_font_size=20,
+        xaxis_title="Project Name",
+        yaxis_title="Time (minutes)",
+        height=400
+    )
+    return fig
+
 def load_profile_image():
     try:
         image_path = "PHOTO.jpg"
@@ -883,6 +795,9 @@ elif page == "🌟 Personal Traits":
         """)
 
 elif page == "📈 Project Showcase":
+    # 先在背景準備本頁圖片，圖表繪製時同步進行
+    image_registry.prefetch("projects")
+
     st.markdown("# 🤖 AI & Data Science Projects")
     
     # 大標題區塊
@@ -898,14 +813,14 @@ elif page == "📈 Project Showcase":
     # LLM 核心技術圖示區 - 使用 PPT 圖片
     st.markdown("### 🧠 Core Technology Platforms")
     
-    # 取得圖片 base64
-    ollama_img = LLM_IMAGES.get("slide2_img4", {}).get("base64", "")  # OLLAMA 羊駝圖
-    innogpt_img = LLM_IMAGES.get("slide4_img3", {}).get("base64", "")  # INNO GPT 機器人
+    # 圖片鍵值
+    ollama_img = "slide2_img4"  # OLLAMA 羊駝圖
+    innogpt_img = "slide4_img3"  # INNO GPT 機器人
     
     col1, col2, col3 = st.columns(3)
     
     with col1:
-        img_html = f'<img src="data:image/png;base64,{ollama_img}" style="width:120px; height:120px; object-fit:contain;">' if ollama_img else '<div style="font-size: 4em;">🦙</div>'
+        img_html = image_registry.img_tag(ollama_img, 120, fallback='<div style="font-size: 4em;">🦙</div>')
         st.markdown(f"""
         <div style='background: linear-gradient(135deg, #232526 0%, #414345 100%); padding: 25px; border-radius: 15px; text-align: center; border: 2px solid #00d4ff;'>
             {img_html}
@@ -916,7 +831,7 @@ elif page == "📈 Project Showcase":
         """, unsafe_allow_html=True)
     
     with col2:
-        img_html = f'<img src="data:image/png;base64,{innogpt_img}" style="width:120px; height:120px; object-fit:contain;">' if innogpt_img else '<div style="font-size: 4em;">🧠</div>'
+        img_html = image_registry.img_tag(innogpt_img, 120, fallback='<div style="font-size: 4em;">🧠</div>')
         st.markdown(f"""
         <div style='background: linear-gradient(135deg, #0f2027 0%, #203a43 50%, #2c5364 100%); padding: 25px; border-radius: 15px; text-align: center; border: 2px solid #10a37f;'>
             {img_html}
@@ -941,17 +856,17 @@ elif page == "📈 Project Showcase":
     # 五大功能圖示 - 使用 PPT Slide 1 的圖示
     st.markdown("### ⚡ 5 AI Application Features")
     
-    # 取得五大功能圖示
-    icon1 = LLM_IMAGES.get("slide1_img1", {}).get("base64", "")  # Semantic Analysis
-    icon2 = LLM_IMAGES.get("slide1_img6", {}).get("base64", "")  # Image Analysis
-    icon3 = LLM_IMAGES.get("slide1_img3", {}).get("base64", "")  # Data Analytics
-    icon4 = LLM_IMAGES.get("slide1_img4", {}).get("base64", "")  # Database Query
-    icon5 = LLM_IMAGES.get("slide1_img2", {}).get("base64", "")  # Speech Recognition
+    # 五大功能圖示鍵值
+    icon1 = "slide1_img1"  # Semantic Analysis
+    icon2 = "slide1_img6"  # Image Analysis
+    icon3 = "slide1_img3"  # Data Analytics
+    icon4 = "slide1_img4"  # Database Query
+    icon5 = "slide1_img2"  # Speech Recognition
     
     col1, col2, col3, col4, col5 = st.columns(5)
     
     with col1:
-        img_html = f'<img src="data:image/png;base64,{icon1}" style="width:70px; height:70px; object-fit:contain;">' if icon1 else '<span style="font-size: 2.5em;">🗣️</span>'
+        img_html = image_registry.img_tag(icon1, 70, fallback='<span style="font-size: 2.5em;">🗣️</span>')
         st.markdown(f"""
         <div style='text-align: center;'>
             <div style='background: linear-gradient(180deg, #667eea 0%, #764ba2 100%); padding: 15px; border-radius: 15px; width: 100px; height: 100px; margin: 0 auto; display: flex; align-items: center; justify-content: center;'>
@@ -962,7 +877,7 @@ elif page == "📈 Project Showcase":
         """, unsafe_allow_html=True)
     
     with col2:
-        img_html = f'<img src="data:image/png;base64,{icon2}" style="width:70px; height:70px; object-fit:contain;">' if icon2 else '<span style="font-size: 2.5em;">🖼️</span>'
+        img_html = image_registry.img_tag(icon2, 70, fallback='<span style="font-size: 2.5em;">🖼️</span>')
         st.markdown(f"""
         <div style='text-align: center;'>
             <div style='background: linear-gradient(180deg, #f093fb 0%, #f5576c 100%); padding: 15px; border-radius: 15px; width: 100px; height: 100px; margin: 0 auto; display: flex; align-items: center; justify-content: center;'>
@@ -973,7 +888,7 @@ elif page == "📈 Project Showcase":
         """, unsafe_allow_html=True)
     
     with col3:
-        img_html = f'<img src="data:image/png;base64,{icon3}" style="width:70px; height:70px; object-fit:contain;">' if icon3 else '<span style="font-size: 2.5em;">📊</span>'
+        img_html = image_registry.img_tag(icon3, 70, fallback='<span style="font-size: 2.5em;">📊</span>')
         st.markdown(f"""
         <div style='text-align: center;'>
             <div style='background: linear-gradient(180deg, #11998e 0%, #38ef7d 100%); padding: 15px; border-radius: 15px; width: 100px; height: 100px; margin: 0 auto; display: flex; align-items: center; justify-content: center;'>
@@ -984,7 +899,7 @@ elif page == "📈 Project Showcase":
         """, unsafe_allow_html=True)
     
     with col4:
-        img_html = f'<img src="data:image/png;base64,{icon4}" style="width:70px; height:70px; object-fit:contain;">' if icon4 else '<span style="font-size: 2.5em;">🗄️</span>'
+        img_html = image_registry.img_tag(icon4, 70, fallback='<span style="font-size: 2.5em;">🗄️</span>')
         st.markdown(f"""
         <div style='text-align: center;'>
             <div style='background: linear-gradient(180deg, #4facfe 0%, #00f2fe 100%); padding: 15px; border-radius: 15px; width: 100px; height: 100px; margin: 0 auto; display: flex; align-items: center; justify-content: center;'>
@@ -995,7 +910,7 @@ elif page == "📈 Project Showcase":
         """, unsafe_allow_html=True)
     
     with col5:
-        img_html = f'<img src="data:image/png;base64,{icon5}" style="width:70px; height:70px; object-fit:contain;">' if icon5 else '<span style="font-size: 2.5em;">🎤</span>'
+        img_html = image_registry.img_tag(icon5, 70, fallback='<span style="font-size: 2.5em;">🎤</span>')
         st.markdown(f"""
         <div style='text-align: center;'>
             <div style='background: linear-gradient(180deg, #fa709a 0%, #fee140 100%); padding: 15px; border-radius: 15px; width: 100px; height: 100px; margin: 0 auto; display: flex; align-items: center; justify-content: center;'>
@@ -1008,15 +923,15 @@ elif page == "📈 Project Showcase":
     st.markdown("<br>", unsafe_allow_html=True)
     st.markdown("### 📦 Application Project Details")
     
-    # 取得更多圖片用於專案卡片
-    ollama_card_img = LLM_IMAGES.get("slide2_img4", {}).get("base64", "")  # OLLAMA 羊駝圖
-    innogpt_card_img = LLM_IMAGES.get("slide4_img3", {}).get("base64", "")  # INNO GPT 機器人
+    # 專案卡片圖片鍵值
+    ollama_card_img = "slide2_img4"  # OLLAMA 羊駝圖
+    innogpt_card_img = "slide4_img3"  # INNO GPT 機器人
     
     # 六大功能卡片
     col1, col2, col3 = st.columns(3)
     
     with col1:
-        img_html = f'<img src="data:image/png;base64,{ollama_card_img}" style="width:80px; height:80px; object-fit:contain; float:right;">' if ollama_card_img else ''
+        img_html = image_registry.img_tag(ollama_card_img, 80, style="float:right;")
         st.markdown(f"""
         <div style='background: linear-gradient(135deg, #11998e 0%, #38ef7d 100%); padding: 20px; border-radius: 15px; min-height: 280px;'>
             {img_html}
@@ -1032,7 +947,7 @@ elif page == "📈 Project Showcase":
         """, unsafe_allow_html=True)
     
     with col2:
-        img_html = f'<img src="data:image/png;base64,{ollama_card_img}" style="width:80px; height:80px; object-fit:contain; float:right;">' if ollama_card_img else ''
+        img_html = image_registry.img_tag(ollama_card_img, 80, style="float:right;")
         st.markdown(f"""
         <div style='background: linear-gradient(135deg, #4facfe 0%, #00f2fe 100%); padding: 20px; border-radius: 15px; min-height: 280px;'>
             {img_html}
@@ -1048,7 +963,7 @@ elif page == "📈 Project Showcase":
         """, unsafe_allow_html=True)
     
     with col3:
-        img_html = f'<img src="data:image/png;base64,{innogpt_card_img}" style="width:80px; height:80px; object-fit:contain; float:right;">' if innogpt_card_img else ''
+        img_html = image_registry.img_tag(innogpt_card_img, 80, style="float:right;")
         st.markdown(f"""
         <div style='background: linear-gradient(135deg, #f093fb 0%, #f5576c 100%); padding: 20px; border-radius: 15px; min-height: 280px;'>
             {img_html}
@@ -1067,7 +982,7 @@ elif page == "📈 Project Showcase":
     col1, col2, col3 = st.columns(3)
     
     with col1:
-        img_html = f'<img src="data:image/png;base64,{innogpt_card_img}" style="width:80px; height:80px; object-fit:contain; float:right;">' if innogpt_card_img else ''
+        img_html = image_registry.img_tag(innogpt_card_img, 80, style="float:right;")
         st.markdown(f"""
         <div style='background: linear-gradient(135deg, #667eea 0%, #764ba2 100%); padding: 20px; border-radius: 15px; min-height: 280px;'>
             {img_html}
@@ -1098,7 +1013,7 @@ elif page == "📈 Project Showcase":
         """, unsafe_allow_html=True)
     
     with col3:
-        img_html = f'<img src="data:image/png;base64,{ollama_card_img}" style="width:80px; height:80px; object-fit:contain; float:right;">' if ollama_card_img else ''
+        img_html = image_registry.img_tag(ollama_card_img, 80, style="float:right;")
         st.markdown(f"""
         <div style='background: linear-gradient(135deg, #232526 0%, #414345 100%); padding: 20px; border-radius: 15px; min-height: 280px; border: 2px solid #00d4ff;'>
             {img_html}
@@ -1124,19 +1039,7 @@ elif page == "📈 Project Showcase":
         "Efficiency Gain": ["92%", "92%", "89%", "83%"]
     }
     
-    fig = go.Figure(data=[
-        go.Bar(name='Original Time (min)', x=benefit_data["Project"], y=benefit_data["Original Time"], marker_color='rgba(255, 99, 71, 0.7)'),
-        go.Bar(name='Optimized Time (min)', x=benefit_data["Project"], y=benefit_data["Optimized Time"], marker_color='rgba(60, 179, 113, 0.7)')
-    ])
-    
-    fig.update_layout(
-        title='LLM Project Efficiency Comparison',
-        barmode='group',
-        title_font_size=20,
-        xaxis_title="Project Name",
-        yaxis_title="Time (minutes)",
-        height=400
-    )
+    fig = figure_cache.get(build_benefit_chart, benefit_data)
     st.plotly_chart(fig, use_container_width=True)
     
     st.markdown("---")
@@ -1331,7 +1234,7 @@ elif page == "🔬 Project Analysis":
         style K fill:#e8f5e9
         style L fill:#fce4ec
     """
-    st_mermaid(llm_tech_flow)
+    render_mermaid(llm_tech_flow)
     
     st.markdown("---")
 
@@ -1389,7 +1292,7 @@ elif page == "🔬 Project Analysis":
 
     # Time series decomposition plot
     ts_data = generate_process_data(200)
-    decomposition = seasonal_decompose(ts_data['temperature'], period=24)
+    decomposition = tsa_seasonal.seasonal_decompose(ts_data['temperature'], period=24)
 
     fig = make_subplots(rows=4, cols=1,
                        subplot_titles=('Original Signal', 'Trend Component',
@@ -1422,7 +1325,7 @@ elif page == "🔬 Project Analysis":
     process_data = generate_process_data(1000)
 
     # K-means clustering
-    kmeans = KMeans(n_clusters=3, random_state=42)
+    kmeans = sk_cluster.KMeans(n_clusters=3, random_state=42)
     clusters = kmeans.fit_predict(process_data[['temperature', 'pressure']])
 
     # Clustering plot
@@ -1605,8 +1508,8 @@ elif page == "🏆 Certifications":
 </div>""", unsafe_allow_html=True)
         
         # Display images for this category
-        if category in LICENSE_IMAGES and LICENSE_IMAGES[category]:
-            images = LICENSE_IMAGES[category]
+        images = image_registry.collection(category)
+        if images:
             
             # Display 4 images per row
             cols_per_row = 4
@@ -1614,11 +1517,11 @@ elif page == "🏆 Certifications":
                 cols = st.columns(cols_per_row)
                 for j, col in enumerate(cols):
                     if i + j < len(images):
-                        img_data = images[i + j]
+                        img_src = image_registry.get_src(images[i + j])
                         with col:
                             st.markdown(
                                 f'<div style="height: 200px; overflow: hidden; border-radius: 10px; margin-bottom: 10px; box-shadow: 0 4px 8px rgba(0,0,0,0.1);">'
-                                f'<img src="data:image/{img_data["ext"]};base64,{img_data["base64"]}" style="width:100%; height:100%; object-fit:cover;">'
+                                f'<img src="{img_src}" style="width:100%; height:100%; object-fit:cover;">'
                                 f'</div>',
                                 unsafe_allow_html=True
                             )
@@ -1667,3 +1570,9 @@ st.markdown("""
     &copy; 2025 Patrick Liou | AI Enhanced Resume
 </div>
 """, unsafe_allow_html=True)
+
+# Import-time report (?importtime=1): per-module cost of the deferred ML stacks
+if "importtime" in st.query_params:
+    with st.sidebar:
+        with st.expander("⏱️ Import time"):
+            st.code(format_import_report())
@@ -0,0 +1,21 @@
+import importlib
+
+# 導航選項 -> 頁面模組；模組在第一次被選取時才載入（含 plotly、mermaid 等相依套件）
+PAGES = {
+    "📊 個人總覽": "sections.overview",
+    "💼 專業經歷": "sections.experience",
+    "🎓 教育背景": "sections.education",
+    "🛠️ 技能專長": "sections.skills",
+    "🌟 個人特質": "sections.traits",
+    "📈 專案展示": "sections.projects",
+    "🔬 專案分析": "sections.analysis",
+    "🏆 證照展示": "sections.licenses"
+}
+
+
+def render_page(page, **context):
+    """載入（已載入則直接取用）並顯示頁面"""
+    importlib.import_module(PAGES[page]).render(**context)
+
+
+__all__ = ['PAGES', 'render_page']
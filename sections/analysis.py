@@ -0,0 +1,162 @@
+import streamlit as st
+import pandas as pd
+import numpy as np
+import plotly.express as px
+import plotly.graph_objects as go
+
+from utils.diagram_cache import render_mermaid
+
+
+def render(theme):
+    """🔬 專案分析"""
+    st.markdown("# 進階數據分析")
+    
+    # LLM 大語言模型技術展示
+    st.markdown("## 🤖 大語言模型技術與展望")
+    
+    st.markdown("""
+    運用大語言模型技術，整合多元功能實現製造業智能化轉型：
+    """)
+    
+    # LLM 核心功能展示
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        st.info("#### 🗣️ 語意分析")
+        st.markdown("自然語言處理與理解")
+    with col2:
+        st.success("#### 🖼️ 圖片分析")
+        st.markdown("視覺識別與缺陷檢測")
+    with col3:
+        st.warning("#### 📊 數據分析")
+        st.markdown("智能數據處理與洞察")
+    
+    col4, col5, col6 = st.columns(3)
+    with col4:
+        st.error("#### 🗄️ 資料庫查詢")
+        st.markdown("自然語言轉 SQL 查詢")
+    with col5:
+        st.info("#### 🎤 語音辨識")
+        st.markdown("Whisper 會議記錄系統")
+    with col6:
+        st.success("#### 🔄 RAG 應用")
+        st.markdown("知識檢索增強生成")
+    
+    st.markdown("---")
+    
+    # LLM 技術架構圖
+    st.markdown("### 🏗️ LLM 技術架構")
+    llm_tech_flow = """
+    graph LR
+        A[數據輸入] --> B{大語言模型}
+        B --> C[OLLAMA<br>本機運行]
+        B --> D[INNO GPT<br>API 調用]
+        B --> E[Whisper<br>語音辨識]
+        
+        C --> F[機況分類]
+        C --> G[Release分析]
+        D --> H[RAG處理]
+        D --> I[RPSC分析]
+        E --> J[會議整理]
+        
+        F --> K[(資料庫)]
+        G --> K
+        H --> K
+        I --> K
+        J --> K
+        
+        K --> L[報表呈現]
+        
+        style A fill:#e1f5fe
+        style B fill:#fff3e0
+        style K fill:#e8f5e9
+        style L fill:#fce4ec
+    """
+    render_mermaid(llm_tech_flow)
+    
+    st.markdown("---")
+
+    # 原有製程分析內容
+    st.markdown("""
+    ## 製程分析
+    - 即時監控與分析製程參數
+    - 預測性維護與異常檢測
+    - 品質控制與優化
+    """, unsafe_allow_html=True)
+
+    # 生成製程數據
+    process_data = pd.DataFrame(np.random.randn(500, 3), columns=['溫度', '壓力', '品質'])
+
+    # 相關性熱圖
+    corr = process_data.corr()
+    fig = px.imshow(corr,
+                   title='參數相關性矩陣',
+                   color_continuous_scale='RdBu',
+                   labels={'color': '相關係數'})
+    fig.update_layout(
+        title_font_size=24,
+        font=dict(size=16),
+        legend=dict(
+            font=dict(size=16),
+            title_font=dict(size=16)
+        ),
+        xaxis=dict(
+            title_font=dict(size=16),
+            tickfont=dict(size=14)
+        ),
+        yaxis=dict(
+            title_font=dict(size=16),
+            tickfont=dict(size=14)
+        ),
+        plot_bgcolor='white',
+        showlegend=True
+    )
+
+    fig.update_traces(
+        marker=dict(size=12,
+                   line=dict(width=1, color='white')),
+        selector=dict(mode='markers')
+    )
+
+    st.plotly_chart(fig)
+
+    # 時間序列分析
+    st.markdown("## 時間序列分析", unsafe_allow_html=True)
+    dates = pd.date_range(start='2024-01-01', periods=100)
+    ts_data = pd.DataFrame({
+        '日期': dates,
+        '溫度': np.random.normal(25, 2, 100) + np.sin(np.linspace(0, 10, 100)) * 5,
+        '壓力': np.random.normal(100, 5, 100) + np.cos(np.linspace(0, 10, 100)) * 10
+    })
+
+    fig = px.line(ts_data, x='日期', y=['溫度', '壓力'],
+                 title='製程參數趨勢分析')
+    fig.update_layout(
+        title_font_size=24,
+        font=dict(size=16),
+        legend=dict(font=dict(size=16))
+    )
+    st.plotly_chart(fig)
+
+    # 品質控制圖
+    st.markdown("## 品質控制", unsafe_allow_html=True)
+    quality_data = pd.DataFrame({
+        '樣本': range(1, 51),
+        '測量值': np.random.normal(100, 2, 50)
+    })
+
+    ucl = quality_data['測量值'].mean() + 3 * quality_data['測量值'].std()
+    lcl = quality_data['測量值'].mean() - 3 * quality_data['測量值'].std()
+
+    fig = go.Figure()
+    fig.add_trace(go.Scatter(x=quality_data['樣本'], y=quality_data['測量值'],
+                            mode='lines+markers', name='測量值'))
+    fig.add_hline(y=ucl, line_dash="dash", line_color="red", name='UCL')
+    fig.add_hline(y=lcl, line_dash="dash", line_color="red", name='LCL')
+    fig.update_layout(
+        title='品質控制圖',
+        title_font_size=24,
+        font=dict(size=16),
+        xaxis_title="樣本編號",
+        yaxis_title="測量值"
+    )
+    st.plotly_chart(fig)
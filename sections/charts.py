@@ -0,0 +1,73 @@
+import plotly.express as px
+import plotly.graph_objects as go
+
+
+# 圖表建構函數（由 figure_cache 依輸入資料快取）
+def build_radar_chart(categories, values, name, title):
+    fig = go.Figure()
+    fig.add_trace(go.Scatterpolar(
+        r=values,
+        theta=categories,
+        fill='toself',
+        name=name
+    ))
+
+    fig.update_layout(
+        polar=dict(
+            radialaxis=dict(
+                visible=True,
+                range=[0, 100]
+            )),
+        showlegend=False,
+        title={
+            'text': title,
+            'font': {'size': 24}
+        },
+        height=500
+    )
+    return fig
+
+def build_progress_chart(projects, progress):
+    fig = px.bar(
+        x=progress,
+        y=projects,
+        orientation='h',
+        labels={"x": "進度完成百分比 (%)", "y": "專案名稱"}
+    )
+    fig.update_layout(
+        xaxis_range=[0, 100],
+        height=450,
+        margin=dict(l=20, r=50, t=30, b=50),
+        font=dict(size=14),
+        yaxis=dict(tickfont=dict(size=14)),
+        xaxis=dict(tickfont=dict(size=12), title_font=dict(size=14))
+    )
+    # 添加標籤
+    fig.update_traces(
+        texttemplate='%{x}%',
+        textposition='outside',
+        textfont=dict(size=14),
+        marker_color='rgba(74, 144, 226, 0.7)',
+        hoverinfo='text',
+        hovertext=[f"{p}: {v}%" for p, v in zip(projects, progress)]
+    )
+    return fig
+
+def build_benefit_chart(benefit_data):
+    fig = go.Figure(data=[
+        go.Bar(name='原始耗時 (分鐘)', x=benefit_data["專案名稱"], y=benefit_data["原始耗時"], 
+               marker_color='rgba(255, 99, 71, 0.7)', text=benefit_data["原始耗時"], textposition='outside'),
+        go.Bar(name='優化後耗時 (分鐘)', x=benefit_data["專案名稱"], y=benefit_data["優化後耗時"], 
+               marker_color='rgba(60, 179, 113, 0.7)', text=benefit_data["優化後耗時"], textposition='outside')
+    ])
+    
+    fig.update_layout(
+        barmode='group',
+        xaxis_title="專案名稱",
+        yaxis_title="耗時 (分鐘)",
+        height=400,
+        font=dict(size=14),
+        legend=dict(font=dict(size=14)),
+        margin=dict(t=30)
+    )
+    return fig
@@ -0,0 +1,127 @@
+import streamlit as st
+
+from sections.charts import build_radar_chart
+from utils.diagram_cache import render_mermaid
+from utils.figure_cache import figure_cache
+
+
+def render(theme):
+    """🎓 教育背景"""
+    col1, col2 = st.columns([2, 1])
+
+    with col1:
+        # 台灣人工智慧學校 - AI技術領袖班 (最新)
+        with st.container():
+            st.markdown("### 🤖 台灣人工智慧學校")
+            st.markdown("**2020年 - 2021年** | AI技術領袖班")
+            st.markdown("""
+            - 深度學習與神經網路架構設計
+            - AI專案管理與團隊領導
+            - 產業AI應用實戰
+            """)
+        
+        st.divider()
+        
+        # 台灣人工智慧學校 - AI經理人研修班
+        with st.container():
+            st.markdown("### 🤖 台灣人工智慧學校")
+            st.markdown("**2018年 - 2019年** | AI經理人研修班")
+            st.markdown("""
+            - 機器學習與資料科學基礎
+            - AI策略規劃與商業應用
+            - 數位轉型與創新管理
+            """)
+        
+        st.divider()
+        
+        # 交通大學
+        with st.container():
+            st.markdown("### 🎓 國立交通大學")
+            st.markdown("**2015年9月 - 2018年1月** | 管理科學碩士（MBA）")
+            st.markdown("""
+            - 專業課程：數據分析與商業智慧、營運管理與策略規劃、專案管理與領導力
+            - 研究方向：製造業數位轉型與AI應用
+            """)
+        
+        st.divider()
+        
+        # 台灣大學
+        with st.container():
+            st.markdown("### 🎓 國立台灣大學")
+            st.markdown("**2015年3月 - 2017年6月** | 持續教育法律課程")
+            st.markdown("""
+            - 專業課程：商業法律、智慧財產權、勞動法規
+            - 研究方向：科技產業法律實務應用
+            """)
+        
+        st.divider()
+        
+        # 台科大
+        with st.container():
+            st.markdown("### 🎓 國立台灣科技大學")
+            st.markdown("**2006年9月 - 2008年6月** | 化學工程碩士")
+            st.markdown("""
+            - 專業課程：化工單元操作、反應工程、程序控制
+            - 研究方向：製程最佳化與控制
+            """)
+        
+        st.divider()
+        
+        # 逢甲大學
+        with st.container():
+            st.markdown("### 🎓 逢甲大學")
+            st.markdown("**2002年9月 - 2006年6月** | 化學工程學士")
+            st.markdown("""
+            - 專業課程：化工原理、物理化學、化工熱力學
+            - 專題研究：製程監控與自動化
+            """)
+
+    with col2:
+        # 添加知識領域分布雷達圖
+        knowledge_areas = ['化工製程', '數據分析', '管理實務', '法律知識', '智能製造']
+        knowledge_scores = [95, 90, 85, 80, 92]
+
+        fig = figure_cache.get(build_radar_chart, knowledge_areas, knowledge_scores, '知識領域分布', '知識領域分布')
+        st.plotly_chart(fig, use_container_width=True)
+
+    with col2:
+        # 添加學習進展時間線
+        st.markdown("### 學習歷程")
+        education_chart = """
+        graph TD
+            A[逢甲大學<br>化工學士] --> B[台科大<br>化工碩士]
+            B --> C[台大<br>法律課程]
+            C --> D[交大<br>管理碩士]
+            D --> E[台灣AI學校<br>經理人班]
+            E --> F[台灣AI學校<br>技術領袖班]
+
+            style A fill:#f9f,stroke:#333,stroke-width:4px
+            style B fill:#bbf,stroke:#333,stroke-width:4px
+            style C fill:#ddf,stroke:#333,stroke-width:4px
+            style D fill:#dfd,stroke:#333,stroke-width:4px
+            style E fill:#ffd,stroke:#333,stroke-width:4px
+            style F fill:#fdd,stroke:#333,stroke-width:4px
+        """
+        render_mermaid(education_chart)
+
+        # 添加專業技能評分
+        st.markdown("### 專業技能評分")
+        col1, col2, col3 = st.columns(3)
+
+        with col1:
+            st.markdown("#### 化工專業")
+            st.progress(0.95)
+            st.markdown("#### 數據分析")
+            st.progress(0.90)
+
+        with col2:
+            st.markdown("#### 法律知識")
+            st.progress(0.85)
+            st.markdown("#### 管理能力")
+            st.progress(0.88)
+        
+        with col3:
+            st.markdown("#### AI/LLM 應用")
+            st.progress(0.88)
+            st.markdown("#### Vibe Coding")
+            st.progress(0.85)
@@ -0,0 +1,98 @@
+import streamlit as st
+
+from sections.charts import build_radar_chart
+from utils.diagram_cache import render_mermaid
+from utils.figure_cache import figure_cache
+
+
+def render(theme):
+    """💼 專業經歷"""
+    col1, col2 = st.columns([2, 1])
+
+    with col1:
+        # 群創光電 (現職)
+        with st.container():
+            st.markdown("### 🏢 群創光電 (Innolux Corporation)")
+            st.markdown("**2014年12月 - 至今** | 製程工程師 / Team Leader")
+            st.markdown("""
+            - 領導智能工廠專案，成功導入工業4.0解決方案，顯著提升生產效率
+            - 開發YOLOv4缺陷檢測模型，縮短反饋時間並提高缺陷檢出率60%
+            - 主導3項六標準差專案，優化製程參數並降低產品次品率，節省2100萬台幣/年
+            - 建立大語言模型(LLM)智能應用系統，實現跨資料庫查詢與異常分析，資料整理時間縮短92%
+            - 開發 AI 自動化機況分類與 RPSC 數據分析系統，提升異常處理效率
+            - 導入 Whisper 語音辨識系統，實現會議記錄自動化與智能摘要
+            """)
+        
+        st.divider()
+        
+        # 台積電
+        with st.container():
+            st.markdown("### 🏢 台積電 (TSMC)")
+            st.markdown("**2014年3月 - 2014年12月** | 設備工程師")
+            st.markdown("""
+            - 優化製程工具參數，提升產量與穩定性，缺陷率改善4%
+            - 減少系統崩潰率至5%，提升設備可用性與產能利用率
+            """)
+        
+        st.divider()
+        
+        # 台灣水泥
+        with st.container():
+            st.markdown("### 🏢 台灣水泥 (Taiwan Cement Corp)")
+            st.markdown("**2013年9月 - 2014年3月** | 儲備幹部(MA)")
+            st.markdown("""
+            - 負責生產流程監控與優化，縮短瓶頸工序時間15%
+            - 協助開發新PDA系統，提高製程自動化程度
+            """)
+        
+        st.divider()
+        
+        # 群創光電 (早期)
+        with st.container():
+            st.markdown("### 🏢 群創光電 (Innolux Corporation)")
+            st.markdown("**2010年1月 - 2013年9月** | 製程工程師")
+            st.markdown("""
+            - 協助建置新廠，完成試量產並縮短建廠時程30%
+            - 分析設備故障原因並提供解決方案，提高設備稼動率25%
+            """)
+
+    with col2:
+        skills = ['領導能力', '技術創新', '專案管理', '問題解決', '團隊協作']
+        values = [95, 90, 92, 88, 93]
+
+        fig = figure_cache.get(build_radar_chart, skills, values, '核心能力', '核心能力評估')
+        st.plotly_chart(fig, use_container_width=True)
+
+        # 添加職涯發展歷程
+        st.markdown("### 職涯發展歷程")
+        career_chart = """
+        graph TD
+            A[化工背景] --> B[製程整合]
+            B --> C[設備優化]
+            C --> D[智能製造]
+            D --> E[AI應用開發]
+
+            style A fill:#f9f,stroke:#333,stroke-width:4px
+            style B fill:#bbf,stroke:#333,stroke-width:4px
+            style C fill:#ddf,stroke:#333,stroke-width:4px
+            style D fill:#fdd,stroke:#333,stroke-width:4px
+            style E fill:#dfd,stroke:#333,stroke-width:4px
+        """
+        render_mermaid(career_chart)
+
+        st.markdown("### 核心能力成長")
+        core_skills_chart = """
+        graph TD
+            A[製程知識] --> B[數據分析]
+            B --> C[AI技術]
+            A --> D[良率提升]
+            D --> E[智能製造]
+            C --> E
+
+            style A fill:#f9f,stroke:#333,stroke-width:4px
+            style B fill:#bbf,stroke:#333,stroke-width:4px
+            style C fill:#ddf,stroke:#333,stroke-width:4px
+            style D fill:#fdd,stroke:#333,stroke-width:4px
+            style E fill:#dfd,stroke:#333,stroke-width:4px
+        """
+        render_mermaid(core_skills_chart)
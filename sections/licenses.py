@@ -0,0 +1,183 @@
+import streamlit as st
+
+from utils.asset_store import image_registry
+
+
+def render(theme):
+    """🏆 證照展示"""
+    st.markdown("# 🏆 證照展示")
+    
+    st.markdown("""
+    <div style='background: linear-gradient(135deg, #667eea 0%, #764ba2 100%); padding: 25px; border-radius: 15px; margin-bottom: 20px;'>
+        <h3 style='color: white; margin: 0;'>🌟 活到老，學到老</h3>
+        <p style='color: #f0f0f0; margin-top: 10px;'>
+        除了專業技術的持續精進，我也熱衷於探索不同領域的知識與技能。<br>
+        2024年，我利用工作之餘考取了多項餐飲相關證照，展現終身學習的態度與多元發展的熱情。
+        </p>
+    </div>
+    """, unsafe_allow_html=True)
+    
+    # 證照統計卡片
+    col1, col2, col3, col4 = st.columns(4)
+    with col1:
+        st.markdown("""
+        <div style='background: linear-gradient(135deg, #ff9a9e 0%, #fecfef 100%); padding: 20px; border-radius: 15px; text-align: center;'>
+            <h1 style='margin: 0; font-size: 3em;'>🍜</h1>
+            <h4 style='margin: 5px 0;'>中餐丙級</h4>
+            <span style='background: #4CAF50; color: white; padding: 3px 10px; border-radius: 10px; font-size: 0.8em;'>✓ 已取得</span>
+        </div>
+        """, unsafe_allow_html=True)
+    with col2:
+        st.markdown("""
+        <div style='background: linear-gradient(135deg, #a8edea 0%, #fed6e3 100%); padding: 20px; border-radius: 15px; text-align: center;'>
+            <h1 style='margin: 0; font-size: 3em;'>🎂</h1>
+            <h4 style='margin: 5px 0;'>蛋糕丙級</h4>
+            <span style='background: #4CAF50; color: white; padding: 3px 10px; border-radius: 10px; font-size: 0.8em;'>✓ 已取得</span>
+        </div>
+        """, unsafe_allow_html=True)
+    with col3:
+        st.markdown("""
+        <div style='background: linear-gradient(135deg, #ffecd2 0%, #fcb69f 100%); padding: 20px; border-radius: 15px; text-align: center;'>
+            <h1 style='margin: 0; font-size: 3em;'>🍝</h1>
+            <h4 style='margin: 5px 0;'>西餐丙級</h4>
+            <span style='background: #FF9800; color: white; padding: 3px 10px; border-radius: 10px; font-size: 0.8em;'>⏳ 待取得</span>
+        </div>
+        """, unsafe_allow_html=True)
+    with col4:
+        st.markdown("""
+        <div style='background: linear-gradient(135deg, #d299c2 0%, #fef9d7 100%); padding: 20px; border-radius: 15px; text-align: center;'>
+            <h1 style='margin: 0; font-size: 3em;'>🍸</h1>
+            <h4 style='margin: 5px 0;'>調酒乙級</h4>
+            <span style='background: #FF9800; color: white; padding: 3px 10px; border-radius: 10px; font-size: 0.8em;'>⏳ 待取得</span>
+        </div>
+        """, unsafe_allow_html=True)
+    
+    st.markdown("<br>", unsafe_allow_html=True)
+    
+    # 證照資訊
+    licenses_info = {
+        "語言": {
+            "title": "🌐 多益英語證照",
+            "date": "",
+            "status": "已取得",
+            "status_color": "#4CAF50",
+            "description": "TOEIC 多益英語能力測驗證書，展現國際溝通與跨文化合作能力。",
+            "gradient": "linear-gradient(135deg, #667eea 0%, #764ba2 100%)"
+        },
+        "中餐": {
+            "title": "🍜 中餐烹調丙級",
+            "date": "2024 上半年",
+            "status": "已取得",
+            "status_color": "#4CAF50",
+            "description": "中式料理基礎技能認證，包含刀工、火候控制及各式中華料理烹調技巧。",
+            "gradient": "linear-gradient(135deg, #ff9a9e 0%, #fecfef 100%)"
+        },
+        "蛋糕": {
+            "title": "🎂 烘焙食品丙級 (蛋糕)",
+            "date": "2024 上半年",
+            "status": "已取得",
+            "status_color": "#4CAF50",
+            "description": "西點蛋糕製作技能認證，涵蓋海綿蛋糕、戚風蛋糕等基礎烘焙技術。",
+            "gradient": "linear-gradient(135deg, #a8edea 0%, #fed6e3 100%)"
+        },
+        "西餐": {
+            "title": "🍝 西餐烹調丙級",
+            "date": "2024 下半年",
+            "status": "待取得",
+            "status_color": "#FF9800",
+            "description": "西式料理基礎技能認證，包含醬汁製作、肉類處理及經典西餐烹調。",
+            "gradient": "linear-gradient(135deg, #ffecd2 0%, #fcb69f 100%)"
+        },
+        "調酒": {
+            "title": "🍸 調酒乙級",
+            "date": "2024 下半年",
+            "status": "待取得",
+            "status_color": "#FF9800",
+            "description": "專業調酒技能認證，涵蓋經典調酒配方、創意調酒及吧台服務技巧。",
+            "gradient": "linear-gradient(135deg, #d299c2 0%, #fef9d7 100%)"
+        }
+    }
+    
+    # 顯示每個證照類別
+    for category, info in licenses_info.items():
+        # 構建日期行 - 根據背景決定文字顏色
+        is_dark_bg = category == "語言"  # 語言類別使用深色背景
+        text_color = "#fff" if is_dark_bg else "#333"
+        desc_color = "#e0e0e0" if is_dark_bg else "#555"
+        date_color = "#ddd" if is_dark_bg else "#555"
+        
+        date_html = ""
+        if info.get('date'):
+            date_html = f"<p style='color: {date_color}; margin: 10px 0 5px 0;'>📅 <strong>取得時間</strong>: {info['date']}</p>"
+        
+        # 構建完整的 HTML
+        gradient = info["gradient"]
+        title = info["title"]
+        status_color = info["status_color"]
+        status = info["status"]
+        description = info["description"]
+        
+        st.markdown(f"""<div style="background: {gradient}; padding: 20px; border-radius: 15px; margin-bottom: 15px;">
+<div style="display: flex; justify-content: space-between; align-items: center;">
+<h2 style="margin: 0; color: {text_color};">{title}</h2>
+<span style="background: {status_color}; color: white; padding: 5px 15px; border-radius: 20px; font-weight: bold;">{status}</span>
+</div>
+{date_html}
+<p style="color: {desc_color}; margin: 5px 0;">{description}</p>
+</div>""", unsafe_allow_html=True)
+        
+        # 顯示該類別的圖片
+        images = image_registry.collection(category)
+        if images:
+            
+            # 每行顯示 4 張圖片
+            cols_per_row = 4
+            for i in range(0, len(images), cols_per_row):
+                cols = st.columns(cols_per_row)
+                for j, col in enumerate(cols):
+                    if i + j < len(images):
+                        img_src = image_registry.get_src(images[i + j])
+                        with col:
+                            st.markdown(
+                                f'<div style="height: 200px; overflow: hidden; border-radius: 10px; margin-bottom: 10px; box-shadow: 0 4px 8px rgba(0,0,0,0.1);">'
+                                f'<img src="{img_src}" style="width:100%; height:100%; object-fit:cover;">'
+                                f'</div>',
+                                unsafe_allow_html=True
+                            )
+        else:
+            st.info("📷 圖片載入中...")
+        
+        st.markdown("<br>", unsafe_allow_html=True)
+    
+    # 學習心得
+    st.markdown("""
+    <div style='background: linear-gradient(135deg, #667eea 0%, #764ba2 100%); padding: 25px; border-radius: 15px; margin-top: 20px;'>
+        <h2 style='color: white; text-align: center;'>💡 學習心得</h2>
+    </div>
+    """, unsafe_allow_html=True)
+    
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        st.markdown("""
+        <div style='background: linear-gradient(135deg, #11998e 0%, #38ef7d 100%); padding: 25px; border-radius: 15px; min-height: 180px;'>
+            <h4 style='color: white; margin-top: 0;'>✨ 跨領域學習的價值</h4>
+            <ul style='color: #f0f0f0; margin-bottom: 0;'>
+                <li>培養不同領域的思維方式</li>
+                <li>增進手作與創造力</li>
+                <li>舒壓與工作生活平衡</li>
+            </ul>
+        </div>
+        """, unsafe_allow_html=True)
+    
+    with col2:
+        st.markdown("""
+        <div style='background: linear-gradient(135deg, #4facfe 0%, #00f2fe 100%); padding: 25px; border-radius: 15px; min-height: 180px;'>
+            <h4 style='color: white; margin-top: 0;'>🚀 終身學習的態度</h4>
+            <ul style='color: #f0f0f0; margin-bottom: 0;'>
+                <li>保持對新事物的好奇心</li>
+                <li>挑戰舒適圈，持續成長</li>
+                <li>將學習視為生活的一部分</li>
+            </ul>
+        </div>
+        """, unsafe_allow_html=True)
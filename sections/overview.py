@@ -0,0 +1,61 @@
+from pathlib import Path
+
+import streamlit as st
+
+
+# 圖片處理函數
+def load_profile_image():
+    try:
+        img_path = Path("PHOTO.jpg")
+        if img_path.exists():
+            return str(img_path)
+        else:
+            st.warning(f"無法找到圖片：{img_path}")
+            return None
+    except Exception as e:
+        st.warning(f"載入圖片時發生錯誤：{str(e)}")
+        return None
+
+
+def render(theme):
+    """📊 個人總覽"""
+    col1, col2 = st.columns([1, 2])
+
+    with col1:
+        profile_image = load_profile_image()
+        if profile_image:
+            st.image(profile_image, width=300)
+
+    with col2:
+        st.markdown("# 劉晉亨 Patrick Liou")
+        st.markdown("### 🤖 資深製程整合工程師 | AI與大數據專家")
+        
+        st.markdown("---")
+        
+        # 核心專長
+        st.markdown("#### 🎯 核心專長")
+        col_a, col_b, col_c = st.columns(3)
+        with col_a:
+            st.info("💻 大數據分析")
+        with col_b:
+            st.info("🤖 機器學習")
+        with col_c:
+            st.info("🧠 深度學習")
+        
+        col_d, col_e, col_f = st.columns(3)
+        with col_d:
+            st.warning("💬 大語言模型(LLM)")
+        with col_e:
+            st.warning("🔍 RAG 應用")
+        with col_f:
+            st.warning("🎤 語音辨識")
+        
+        # 專業技能
+        st.markdown("#### 🎯 專業技能")
+        col_g, col_h, col_i = st.columns(3)
+        with col_g:
+            st.success("🔩 製程整合")
+        with col_h:
+            st.success("📈 六標準差")
+        with col_i:
+            st.success("🏭 智能工廠")
@@ -0,0 +1,341 @@
+import streamlit as st
+
+from sections.charts import build_progress_chart, build_benefit_chart
+from utils.asset_store import image_registry
+from utils.diagram_cache import render_mermaid
+from utils.figure_cache import figure_cache
+
+
+def render(theme):
+    """📈 專案展示"""
+    # 先在背景準備本頁圖片，圖表繪製時同步進行
+    image_registry.prefetch("projects")
+
+    # 模擬數據
+    projects = ["📊良率優化", "🔬氣體監控", "🤖製程分析", "🔧設備監控", "📈品質管制", "📧異常解析", "📈數據分析"]
+    progress = [85, 90, 80, 75, 88, 70, 95]
+
+    # 創建條形圖展示項目進度
+    st.markdown("## 專案進度概覽")
+    # 使用 Plotly 替代 Matplotlib
+    fig = figure_cache.get(build_progress_chart, projects, progress)
+    st.plotly_chart(fig, use_container_width=True)
+    
+    # LLM 大語言模型應用專案
+    st.markdown("---")
+    
+    # 大標題區塊
+    st.markdown("""
+    <div style='background: linear-gradient(135deg, #667eea 0%, #764ba2 100%); padding: 30px; border-radius: 15px; margin-bottom: 25px; text-align: center;'>
+        <h1 style='color: white; margin: 0;'>🤖 大語言模型技術與展望</h1>
+        <p style='color: #f0f0f0; margin-top: 10px; font-size: 1.2em;'>
+            語意分析 | 圖片分析 | 數據分析 | 資料庫查詢 | 語音辨識
+        </p>
+    </div>
+    """, unsafe_allow_html=True)
+    
+    # LLM 核心技術圖示區 - 使用 PPT 圖片
+    st.markdown("### 🧠 核心技術平台")
+    
+    # 圖片鍵值
+    ollama_img = "slide2_img4"  # OLLAMA 羊駝圖
+    innogpt_img = "slide4_img3"  # INNO GPT 機器人
+    
+    col1, col2, col3 = st.columns(3)
+    
+    with col1:
+        img_html = image_registry.img_tag(ollama_img, 120, fallback='<div style="font-size: 4em;">🦙</div>')
+        st.markdown(f"""
+        <div style='background: linear-gradient(135deg, #232526 0%, #414345 100%); padding: 25px; border-radius: 15px; text-align: center; border: 2px solid #00d4ff;'>
+            {img_html}
+            <h3 style='color: #00d4ff; margin: 10px 0 0 0;'>OLLAMA</h3>
+            <p style='color: #aaa; margin: 10px 0 0 0;'>本機運行開源 LLM</p>
+            <p style='color: #888; font-size: 0.85em;'>Llama / Mistral / Gemma</p>
+        </div>
+        """, unsafe_allow_html=True)
+    
+    with col2:
+        img_html = image_registry.img_tag(innogpt_img, 120, fallback='<div style="font-size: 4em;">🧠</div>')
+        st.markdown(f"""
+        <div style='background: linear-gradient(135deg, #0f2027 0%, #203a43 50%, #2c5364 100%); padding: 25px; border-radius: 15px; text-align: center; border: 2px solid #10a37f;'>
+            {img_html}
+            <h3 style='color: #10a37f; margin: 10px 0 0 0;'>INNO GPT</h3>
+            <p style='color: #aaa; margin: 10px 0 0 0;'>企業內部 API</p>
+            <p style='color: #888; font-size: 0.85em;'>RAG / 圖片分析 / 數據處理</p>
+        </div>
+        """, unsafe_allow_html=True)
+    
+    with col3:
+        st.markdown("""
+        <div style='background: linear-gradient(135deg, #1a1a2e 0%, #16213e 100%); padding: 25px; border-radius: 15px; text-align: center; border: 2px solid #ff6b6b;'>
+            <div style='font-size: 4em; margin-bottom: 10px;'>🎙️</div>
+            <h3 style='color: #ff6b6b; margin: 0;'>Whisper</h3>
+            <p style='color: #aaa; margin: 10px 0 0 0;'>OpenAI 語音辨識</p>
+            <p style='color: #888; font-size: 0.85em;'>會議紀錄 / 語音轉文字</p>
+        </div>
+        """, unsafe_allow_html=True)
+    
+    st.markdown("<br>", unsafe_allow_html=True)
+    
+    # 五大功能圖示 - 使用 PPT Slide 1 的圖示
+    st.markdown("### ⚡ 五大 AI 應用功能")
+    
+    # 五大功能圖示鍵值
+    icon1 = "slide1_img1"  # 語意分析
+    icon2 = "slide1_img6"  # 圖片分析
+    icon3 = "slide1_img3"  # 數據分析
+    icon4 = "slide1_img4"  # 資料庫查詢
+    icon5 = "slide1_img2"  # 語音辨識
+    
+    col1, col2, col3, col4, col5 = st.columns(5)
+    
+    with col1:
+        img_html = image_registry.img_tag(icon1, 70, fallback='<span style="font-size: 2.5em;">🗣️</span>')
+        st.markdown(f"""
+        <div style='text-align: center;'>
+            <div style='background: linear-gradient(180deg, #667eea 0%, #764ba2 100%); padding: 15px; border-radius: 15px; width: 100px; height: 100px; margin: 0 auto; display: flex; align-items: center; justify-content: center;'>
+                {img_html}
+            </div>
+            <p style='color: #667eea; font-weight: bold; margin-top: 10px;'>語意分析</p>
+        </div>
+        """, unsafe_allow_html=True)
+    
+    with col2:
+        img_html = image_registry.img_tag(icon2, 70, fallback='<span style="font-size: 2.5em;">🖼️</span>')
+        st.markdown(f"""
+        <div style='text-align: center;'>
+            <div style='background: linear-gradient(180deg, #f093fb 0%, #f5576c 100%); padding: 15px; border-radius: 15px; width: 100px; height: 100px; margin: 0 auto; display: flex; align-items: center; justify-content: center;'>
+                {img_html}
+            </div>
+            <p style='color: #f5576c; font-weight: bold; margin-top: 10px;'>圖片分析</p>
+        </div>
+        """, unsafe_allow_html=True)
+    
+    with col3:
+        img_html = image_registry.img_tag(icon3, 70, fallback='<span style="font-size: 2.5em;">📊</span>')
+        st.markdown(f"""
+        <div style='text-align: center;'>
+            <div style='background: linear-gradient(180deg, #11998e 0%, #38ef7d 100%); padding: 15px; border-radius: 15px; width: 100px; height: 100px; margin: 0 auto; display: flex; align-items: center; justify-content: center;'>
+                {img_html}
+            </div>
+            <p style='color: #11998e; font-weight: bold; margin-top: 10px;'>數據分析</p>
+        </div>
+        """, unsafe_allow_html=True)
+    
+    with col4:
+        img_html = image_registry.img_tag(icon4, 70, fallback='<span style="font-size: 2.5em;">🗄️</span>')
+        st.markdown(f"""
+        <div style='text-align: center;'>
+            <div style='background: linear-gradient(180deg, #4facfe 0%, #00f2fe 100%); padding: 15px; border-radius: 15px; width: 100px; height: 100px; margin: 0 auto; display: flex; align-items: center; justify-content: center;'>
+                {img_html}
+            </div>
+            <p style='color: #4facfe; font-weight: bold; margin-top: 10px;'>資料庫查詢</p>
+        </div>
+        """, unsafe_allow_html=True)
+    
+    with col5:
+        img_html = image_registry.img_tag(icon5, 70, fallback='<span style="font-size: 2.5em;">🎤</span>')
+        st.markdown(f"""
+        <div style='text-align: center;'>
+            <div style='background: linear-gradient(180deg, #fa709a 0%, #fee140 100%); padding: 15px; border-radius: 15px; width: 100px; height: 100px; margin: 0 auto; display: flex; align-items: center; justify-content: center;'>
+                {img_html}
+            </div>
+            <p style='color: #fa709a; font-weight: bold; margin-top: 10px;'>語音辨識</p>
+        </div>
+        """, unsafe_allow_html=True)
+    
+    st.markdown("<br>", unsafe_allow_html=True)
+    st.markdown("### 📦 應用專案詳情")
+    
+    # 專案卡片圖片鍵值
+    ollama_card_img = "slide2_img4"  # OLLAMA 羊駝圖
+    innogpt_card_img = "slide4_img3"  # INNO GPT 機器人
+    
+    # 六大功能卡片
+    col1, col2, col3 = st.columns(3)
+    
+    with col1:
+        img_html = image_registry.img_tag(ollama_card_img, 80, style="float:right;")
+        st.markdown(f"""
+        <div style='background: linear-gradient(135deg, #11998e 0%, #38ef7d 100%); padding: 20px; border-radius: 15px; min-height: 280px;'>
+            {img_html}
+            <h3 style='color: white; margin-top: 0;'>🔧 機況報表智能分類</h3>
+            <p style='color: #e0ffe0; font-size: 0.9em;'><strong>技術: OLLAMA 本機運行</strong></p>
+            <ul style='color: #f0f0f0; font-size: 0.95em;'>
+                <li>讀取機況內容自動分類狀態</li>
+                <li>機況報表智能查詢</li>
+                <li>自動存入資料庫</li>
+            </ul>
+            <p style='color: #ffeb3b; font-size: 0.9em;'>💡 解決: 機況分散不易查詢</p>
+        </div>
+        """, unsafe_allow_html=True)
+    
+    with col2:
+        img_html = image_registry.img_tag(ollama_card_img, 80, style="float:right;")
+        st.markdown(f"""
+        <div style='background: linear-gradient(135deg, #4facfe 0%, #00f2fe 100%); padding: 20px; border-radius: 15px; min-height: 280px;'>
+            {img_html}
+            <h3 style='color: white; margin-top: 0;'>📝 Release Table 分析</h3>
+            <p style='color: #e0f7ff; font-size: 0.9em;'><strong>技術: OLLAMA 本機運行</strong></p>
+            <ul style='color: #f0f0f0; font-size: 0.95em;'>
+                <li>讀取 COMMENT 內容分類狀態</li>
+                <li>Release Table 報表分析查詢</li>
+                <li>自動存入資料庫</li>
+            </ul>
+            <p style='color: #ffeb3b; font-size: 0.9em;'>💡 解決: 值班COMMENT雜亂無序</p>
+        </div>
+        """, unsafe_allow_html=True)
+    
+    with col3:
+        img_html = image_registry.img_tag(innogpt_card_img, 80, style="float:right;")
+        st.markdown(f"""
+        <div style='background: linear-gradient(135deg, #f093fb 0%, #f5576c 100%); padding: 20px; border-radius: 15px; min-height: 280px;'>
+            {img_html}
+            <h3 style='color: white; margin-top: 0;'>🎯 當機產品 AI 處理 (RAG)</h3>
+            <p style='color: #ffe0f0; font-size: 0.9em;'><strong>技術: INNO GPT</strong></p>
+            <ul style='color: #f0f0f0; font-size: 0.95em;'>
+                <li>工程師歷史處理異常資料</li>
+                <li>AI 分析與識別 LOG 資料</li>
+                <li>提出有效後續處理建議</li>
+            </ul>
+            <p style='color: #ffeb3b; font-size: 0.9em;'>💡 自動化異常處理流程</p>
+        </div>
+        """, unsafe_allow_html=True)
+    
+    st.markdown("<br>", unsafe_allow_html=True)
+    
+    col4, col5, col6 = st.columns(3)
+    
+    with col4:
+        img_html = image_registry.img_tag(innogpt_card_img, 80, style="float:right;")
+        st.markdown(f"""
+        <div style='background: linear-gradient(135deg, #fa709a 0%, #fee140 100%); padding: 20px; border-radius: 15px; min-height: 280px;'>
+            {img_html}
+            <h3 style='color: #333; margin-top: 0;'>📊 RPSC 數據分析</h3>
+            <p style='color: #555; font-size: 0.9em;'><strong>技術: INNO GPT API</strong></p>
+            <ul style='color: #444; font-size: 0.95em;'>
+                <li>RPSC RAW DATA 繪製 Trend Chart</li>
+                <li>餵圖給 GPT 分析</li>
+                <li>參考 RULE 找出 EP</li>
+                <li>數據清理與自動分析</li>
+            </ul>
+        </div>
+        """, unsafe_allow_html=True)
+    
+    with col5:
+        st.markdown("""
+        <div style='background: linear-gradient(135deg, #a8edea 0%, #fed6e3 100%); padding: 20px; border-radius: 15px; min-height: 280px;'>
+            <h3 style='color: #333; margin-top: 0;'>🎤 會議語音紀錄</h3>
+            <p style='color: #555; font-size: 0.9em;'><strong>技術: Whisper 語音辨識</strong></p>
+            <ul style='color: #444; font-size: 0.95em;'>
+                <li>會議語音自動紀錄</li>
+                <li>智能會議整理</li>
+                <li>重點摘要生成</li>
+            </ul>
+            <p style='color: #e91e63; font-size: 0.9em;'>💡 會議效率大幅提升</p>
+        </div>
+        """, unsafe_allow_html=True)
+    
+    with col6:
+        # 同時顯示 OLLAMA 和 INNO GPT 圖片
+        img_html1 = image_registry.img_tag(innogpt_card_img, 60)
+        img_html2 = image_registry.img_tag(ollama_card_img, 60)
+        st.markdown(f"""
+        <div style='background: linear-gradient(135deg, #667eea 0%, #764ba2 100%); padding: 20px; border-radius: 15px; min-height: 280px;'>
+            <div style='float:right;'>{img_html1}{img_html2}</div>
+            <h3 style='color: white; margin-top: 0;'>🔍 跨資料庫智能查詢</h3>
+            <p style='color: #e0e0ff; font-size: 0.9em;'><strong>技術: GPT/OLLAMA 生成 SQL</strong></p>
+            <ul style='color: #f0f0f0; font-size: 0.95em;'>
+                <li>Yield/機況/Release 限制查詢</li>
+                <li>跨資料庫異常分析</li>
+                <li>報表呈現與自動存檔</li>
+            </ul>
+            <p style='color: #ffeb3b; font-size: 0.9em;'>💡 查詢時間 1HR → 5min</p>
+        </div>
+        """, unsafe_allow_html=True)
+    
+    # 專案效益總覽
+    st.markdown("---")
+    st.markdown("""
+    <div style='background: linear-gradient(135deg, #ff9a9e 0%, #fecfef 100%); padding: 20px; border-radius: 15px; margin-bottom: 20px;'>
+        <h2 style='color: #333; text-align: center; margin: 0;'>📈 專案效益總覽 - 提質、增效、降本、減存</h2>
+    </div>
+    """, unsafe_allow_html=True)
+    
+    # 效益指標卡片
+    col1, col2, col3, col4 = st.columns(4)
+    
+    with col1:
+        st.markdown("""
+        <div style='background: #4CAF50; padding: 20px; border-radius: 15px; text-align: center;'>
+            <h1 style='color: white; margin: 0; font-size: 2.5em;'>92%</h1>
+            <p style='color: #e8f5e9; margin: 5px 0 0 0;'>效率提升</p>
+            <p style='color: #c8e6c9; font-size: 0.8em;'>1 HR → 5 min</p>
+        </div>
+        """, unsafe_allow_html=True)
+    
+    with col2:
+        st.markdown("""
+        <div style='background: #2196F3; padding: 20px; border-radius: 15px; text-align: center;'>
+            <h1 style='color: white; margin: 0; font-size: 2.5em;'>6</h1>
+            <p style='color: #e3f2fd; margin: 5px 0 0 0;'>AI 應用專案</p>
+            <p style='color: #bbdefb; font-size: 0.8em;'>持續擴展中</p>
+        </div>
+        """, unsafe_allow_html=True)
+    
+    with col3:
+        st.markdown("""
+        <div style='background: #FF9800; padding: 20px; border-radius: 15px; text-align: center;'>
+            <h1 style='color: white; margin: 0; font-size: 2.5em;'>3</h1>
+            <p style='color: #fff3e0; margin: 5px 0 0 0;'>技術平台</p>
+            <p style='color: #ffe0b2; font-size: 0.8em;'>OLLAMA/GPT/Whisper</p>
+        </div>
+        """, unsafe_allow_html=True)
+    
+    with col4:
+        st.markdown("""
+        <div style='background: #9C27B0; padding: 20px; border-radius: 15px; text-align: center;'>
+            <h1 style='color: white; margin: 0; font-size: 2.5em;'>∞</h1>
+            <p style='color: #f3e5f5; margin: 5px 0 0 0;'>應用潛力</p>
+            <p style='color: #e1bee7; font-size: 0.8em;'>製造業智能轉型</p>
+        </div>
+        """, unsafe_allow_html=True)
+
+    st.markdown("<br>", unsafe_allow_html=True)
+    
+    # 效益比較圖表
+    benefit_data = {
+        "專案名稱": ["跨資料庫查詢", "機況報表分類", "Release Table 分析", "RPSC 數據分析"],
+        "原始耗時": [60, 60, 45, 30],
+        "優化後耗時": [5, 5, 5, 5],
+    }
+    
+    fig = figure_cache.get(build_benefit_chart, benefit_data)
+    st.plotly_chart(fig, use_container_width=True)
+    
+    # 技術架構圖
+    st.markdown("### 🏗️ 技術架構")
+    llm_architecture = """
+    graph TD
+        A[數據來源] --> B[大語言模型]
+        B --> C[OLLAMA 本機運行]
+        B --> D[INNO GPT API]
+        B --> E[Whisper 語音]
+        C --> F[機況分類]
+        C --> G[Release分析]
+        D --> H[RAG 處理]
+        D --> I[RPSC 分析]
+        E --> J[會議紀錄]
+        F --> K[資料庫]
+        G --> K
+        H --> K
+        I --> K
+        J --> K
+        K --> L[報表呈現]
+        
+        style A fill:#f9f,stroke:#333,stroke-width:2px
+        style B fill:#bbf,stroke:#333,stroke-width:2px
+        style K fill:#dfd,stroke:#333,stroke-width:2px
+        style L fill:#fdd,stroke:#333,stroke-width:2px
+    """
+    render_mermaid(llm_architecture)
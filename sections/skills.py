@@ -0,0 +1,141 @@
+import streamlit as st
+
+from utils.diagram_cache import render_mermaid
+
+
+def render(theme):
+    """🛠️ 技能專長"""
+    st.markdown("## 🛠️ 技能專長")
+    
+    col1, col2, col3, col4 = st.columns(4)
+    
+    with col1:
+        st.info("#### 🔧 技術工具")
+        st.markdown("""
+        - 💻 Python
+        - 🤖 深度學習
+        - 🔩 AutoML
+        - 📊 數據分析
+        - 📈 六標準差
+        - 🏭 智能工廠
+        """)
+    
+    with col2:
+        st.success("#### 💡 製程專長")
+        st.markdown("""
+        - 🔧 半導體製程
+        - 📊 製程參數分析
+        - 🎯 良率提升
+        - 🔩 設備監控
+        """)
+    
+    with col3:
+        st.warning("#### 📈 數據分析")
+        st.markdown("""
+        - 📊 統計分析
+        - 📉 製程能力分析
+        - 🎯 六標準差
+        """)
+    
+    with col4:
+        st.error("#### 🤖 AI & LLM 專長")
+        st.markdown("""
+        - 💬 大語言模型 (LLM)
+        - 🎵 Vibe Coding
+        - 🔍 RAG 應用開發
+        - 🎤 Whisper 語音辨識
+        - 🦜 LangChain/LangFlow
+        - 🧠 Prompt Engineering
+        """)
+
+    # 添加技能評分展示
+    st.markdown("### 💫 專業技能評分")
+
+    # 創建技能數據
+    skills_data = {
+        "製程整合能力": {
+            "半導體/面板製程": 95,
+            "良率分析": 92,
+            "缺陷改善": 90,
+            "製程優化": 88
+        },
+        "技術能力": {
+            "Python開發": 85,
+            "數據分析": 90,
+            "機器學習": 82,
+            "自動化開發": 85
+        },
+        "管理能力": {
+            "專案管理": 88,
+            "團隊領導": 85,
+            "問題解決": 92,
+            "溝通協調": 90
+        }
+    }
+
+    # 使用列顯示技能評分
+    cols = st.columns(len(skills_data))
+    for col, (category, skills) in zip(cols, skills_data.items()):
+        with col:
+            st.markdown(f"#### {category}")
+            for skill, level in skills.items():
+                st.markdown(f"**{skill}**")
+                st.progress(level/100)
+
+    # 三個 Mermaid 圖表並排顯示
+    st.markdown("---")
+    col1, col2, col3 = st.columns(3)
+    
+    with col1:
+        st.markdown("### 職涯發展歷程")
+        career_chart = """
+        graph TD
+            A[化工背景] --> B[製程整合]
+            B --> C[設備優化]
+            C --> D[智能製造]
+            D --> E[AI應用開發]
+
+            style A fill:#f9f,stroke:#333,stroke-width:4px
+            style B fill:#bbf,stroke:#333,stroke-width:4px
+            style C fill:#ddf,stroke:#333,stroke-width:4px
+            style D fill:#fdd,stroke:#333,stroke-width:4px
+            style E fill:#dfd,stroke:#333,stroke-width:4px
+        """
+        render_mermaid(career_chart)
+    
+    with col2:
+        st.markdown("### 核心能力成長")
+        core_skills_chart = """
+        graph TD
+            A[數據處理] --> B[數據分析]
+            B --> C[AI預測]
+            A --> D[資產提升]
+            D --> E[智能製造]
+            C --> E
+
+            style A fill:#f9f,stroke:#333,stroke-width:4px
+            style B fill:#bbf,stroke:#333,stroke-width:4px
+            style C fill:#ddf,stroke:#333,stroke-width:4px
+            style D fill:#fdd,stroke:#333,stroke-width:4px
+            style E fill:#dfd,stroke:#333,stroke-width:4px
+        """
+        render_mermaid(core_skills_chart)
+    
+    with col3:
+        st.markdown("### 學習歷程")
+        education_chart = """
+        graph TD
+            A[逢甲大學<br>化工學士] --> B[台科大<br>化工碩士]
+            B --> C[台大<br>法律課程]
+            C --> D[交大<br>管理碩士]
+            D --> E[台灣AI學校<br>經理人班]
+            E --> F[台灣AI學校<br>技術領袖班]
+
+            style A fill:#f9f,stroke:#333,stroke-width:4px
+            style B fill:#bbf,stroke:#333,stroke-width:4px
+            style C fill:#ddf,stroke:#333,stroke-width:4px
+            style D fill:#dfd,stroke:#333,stroke-width:4px
+            style E fill:#ffd,stroke:#333,stroke-width:4px
+            style F fill:#fdd,stroke:#333,stroke-width:4px
+        """
+        render_mermaid(education_chart)
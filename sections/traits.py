@@ -0,0 +1,54 @@
+import streamlit as st
+
+
+def render(theme):
+    """🌟 個人特質"""
+    st.markdown("## 🌟 個人特質")
+    
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        st.info("#### 🎯 領導力與團隊合作")
+        st.markdown("""
+        - 具備優秀的團隊領導能力
+        - 良好的溝通技巧
+        - 具有同理心
+        """)
+        
+        st.success("#### 💡 專業素養")
+        st.markdown("""
+        - 高度責任感
+        - 注重細節
+        - 追求卓越
+        """)
+    
+    with col2:
+        st.warning("#### 🚀 學習與創新")
+        st.markdown("""
+        - 持續學習的熱情
+        - 創新思維
+        - 解決問題的能力
+        """)
+        
+        st.info("#### 🤝 團隊精神")
+        st.markdown("""
+        - 良好的團隊合作
+        - 積極主動
+        - 樂於分享
+        """)
+
+    # 添加能力評分
+    st.markdown("### 🎯 能力評分")
+    col1, col2 = st.columns(2)
+
+    with col1:
+        st.markdown("#### 領導力")
+        st.progress(0.85)
+        st.markdown("#### 創新力")
+        st.progress(0.90)
+
+    with col2:
+        st.markdown("#### 執行力")
+        st.progress(0.95)
+        st.markdown("#### 學習力")
+        st.progress(0.92)
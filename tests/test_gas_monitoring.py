@@ -0,0 +1,45 @@
+from datetime import datetime, timedelta
+
+import numpy as np
+import pytest
+
+from gas_monitoring import GasMonitoring
+
+
+@pytest.fixture
+def trained(tmp_path):
+    model_path = tmp_path / 'gas_model.pkl'
+    gm = GasMonitoring(model_path=model_path, n_jobs=1)
+    end = datetime(2024, 1, 31)
+    data = gm.generate_data(end - timedelta(days=30), end, seed=0)
+    gm.train_models(data)
+    return model_path, gm, data
+
+
+def test_update_after_warm_load_keeps_training_window(trained):
+    model_path, gm, data = trained
+    restarted = GasMonitoring(model_path=model_path, n_jobs=1)
+    assert restarted.window_buffer is not None
+    assert len(restarted.window_buffer) == len(gm.window_buffer)
+    np.testing.assert_allclose(restarted.fit_mean, gm.fit_mean)
+
+    last = data['timestamp'].iloc[-1]
+    new_row = gm.generate_data(last + timedelta(hours=1), last + timedelta(hours=1), seed=1)
+    restarted.update(new_row)
+
+    for model in restarted.models.values():
+        # 刷新的树与保留的旧树都以整个窗口训练，而不是只有新的一笔
+        assert min(tree.tree_.n_node_samples[0] for tree in model.estimators_) > 1
+    forecast = restarted.predict_future(24)
+    assert forecast['Ar_flow'].std() > 0
+
+    reloaded = GasMonitoring(model_path=model_path, n_jobs=1)
+    assert reloaded.window_buffer.total == len(restarted.window_buffer)
+
+
+def test_update_without_training_window_raises(tmp_path):
+    gm = GasMonitoring(model_path=tmp_path / 'missing.pkl', n_jobs=1)
+    new_row = gm.generate_data(datetime(2024, 1, 1), datetime(2024, 1, 1), seed=0)
+    with pytest.raises(RuntimeError):
+        gm.update(new_row)
+    assert not (tmp_path / 'missing.pkl').exists()
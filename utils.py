@@ -1,7 +1,8 @@
 import json
-import requests
 from datetime import datetime
 from pathlib import Path
+from utils.geolocation import geolocator
+from utils.visitor_tracking import get_client_ip
 
 def load_visitor_data():
     """
@@ -24,11 +25,7 @@ def get_visitor_ip():
     """
     取得訪客 IP 地址
     """
-    try:
-        response = requests.get('https://api.ipify.org?format=json')
-        return response.json()['ip']
-    except:
-        return 'Unknown'
+    return get_client_ip() or 'Unknown'
 
 def update_visitor_count():
     """
@@ -57,17 +54,13 @@ def send_daily_report(visitor_data, today):
     發送每日訪客報告
     """
     ip_locations = []
-    for ip in visitor_data['ip_records'].get(today, []):
-        try:
-            response = requests.get(f'http://ip-api.com/json/{ip}')
-            location = response.json()
-            ip_locations.append(
-                f"IP: {ip}\n"
-                f"Location: {location.get('city', 'Unknown')}, {location.get('country', 'Unknown')}\n"
-                f"Organization: {location.get('org', 'Unknown')}
-            )
-        except:
-            ip_locations.append(f"IP: {ip}, Location: Unknown")
+    locations = geolocator.locate_many(visitor_data['ip_records'].get(today, []))
+    for ip, location in locations.items():
+        ip_locations.append(
+            f"IP: {ip}\n"
+            f"Location: {location['city']}, {location['country']}\n"
+            f"Organization: {location['org']}\n"
+        )
 
     email_content = (
         f"Date: {today}\n"
@@ -1,3 +1,10 @@
-from .visitor_tracking import visitor_tracker
-
 __all__ = ['visitor_tracker']
+
+
+def __getattr__(name):
+    # 只有真正用到 visitor_tracker 時才載入訪問統計（開啟資料庫、啟動背景寫入執行緒），
+    # 其他 utils 子模組可以單獨匯入
+    if name == 'visitor_tracker':
+        from .visitor_tracking import visitor_tracker
+        return visitor_tracker
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,361 @@
+import argparse
+import base64
+import hashlib
+import importlib
+import json
+import logging
+import mimetypes
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Dict, Any, List, Optional, Set, Tuple
+
+from config import ASSET_CONFIG, PAGE_ASSETS
+from utils.image_variants import VariantCache
+
+logger = logging.getLogger(__name__)
+
+MANIFEST_VERSION = 1
+
+
+class AssetStore:
+    """以內容雜湊儲存圖片，manifest 保留原本的 slideN_imgM 鍵值"""
+
+    def __init__(self, objects_dir: Optional[Path] = None, manifest_path: Optional[Path] = None):
+        self.objects_dir = Path(objects_dir or ASSET_CONFIG["objects_dir"])
+        self.manifest_path = Path(manifest_path or ASSET_CONFIG["manifest_path"])
+        self.url_prefix = ASSET_CONFIG["url_prefix"]
+        self._manifest: Optional[Dict[str, Any]] = None
+
+    @property
+    def manifest(self) -> Dict[str, Any]:
+        """延遲載入 manifest（只有幾 KB，不含圖片內容）"""
+        if self._manifest is None:
+            self._manifest = self._load_manifest()
+        return self._manifest
+
+    def _load_manifest(self) -> Dict[str, Any]:
+        """載入 manifest"""
+        try:
+            with open(self.manifest_path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return {"version": MANIFEST_VERSION, "assets": {}, "collections": {}}
+        except Exception as e:
+            logger.error(f"載入資源清單時發生錯誤：{str(e)}")
+            return {"version": MANIFEST_VERSION, "assets": {}, "collections": {}}
+
+    def save_manifest(self) -> None:
+        """保存 manifest，並附上去重統計"""
+        self.manifest["dedup"] = self.dedup_stats()
+        self.manifest_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.manifest_path, 'w', encoding='utf-8') as f:
+            json.dump(self.manifest, f, ensure_ascii=False, indent=2, sort_keys=True)
+            f.write('\n')
+
+    def object_path(self, digest: str, ext: str) -> Path:
+        """取得雜湊對應的檔案路徑"""
+        return self.objects_dir / f"{digest}.{ext}"
+
+    def put(self, key: str, data: bytes, ext: str, filename: Optional[str] = None,
+            collection: Optional[str] = None) -> str:
+        """寫入一張圖片並登記鍵值，回傳內容雜湊"""
+        ext = ext.lower().lstrip('.')
+        digest = hashlib.sha256(data).hexdigest()
+        path = self.object_path(digest, ext)
+        if not path.exists():
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = path.with_suffix(path.suffix + '.tmp')
+            tmp_path.write_bytes(data)
+            tmp_path.replace(path)
+
+        self.manifest["assets"][key] = {
+            "hash": digest,
+            "ext": ext,
+            "size": len(data),
+            "filename": filename or f"{key}.{ext}"
+        }
+        if collection is not None:
+            members = self.manifest["collections"].setdefault(collection, [])
+            if key not in members:
+                members.append(key)
+        return digest
+
+    def entry(self, key: str) -> Optional[Dict[str, Any]]:
+        """取得鍵值的 manifest 記錄"""
+        return self.manifest["assets"].get(key)
+
+    def keys(self) -> List[str]:
+        """列出所有鍵值"""
+        return list(self.manifest["assets"].keys())
+
+    def collection(self, name: str) -> List[str]:
+        """取得分組（例如證照類別）下的鍵值，保持原本順序"""
+        return list(self.manifest["collections"].get(name, []))
+
+    def dedup_stats(self) -> Dict[str, Any]:
+        """統計內容相同的鍵值與節省的位元組數"""
+        canonical: Dict[str, str] = {}
+        aliases: Dict[str, str] = {}
+        logical_bytes = 0
+        stored_bytes = 0
+        for key in sorted(self.manifest["assets"]):
+            entry = self.manifest["assets"][key]
+            logical_bytes += entry["size"]
+            if entry["hash"] in canonical:
+                aliases[key] = canonical[entry["hash"]]
+            else:
+                canonical[entry["hash"]] = key
+                stored_bytes += entry["size"]
+        return {
+            "total_keys": len(self.manifest["assets"]),
+            "unique_objects": len(canonical),
+            "logical_bytes": logical_bytes,
+            "stored_bytes": stored_bytes,
+            "saved_bytes": logical_bytes - stored_bytes,
+            "aliases": aliases
+        }
+
+    def prune(self) -> int:
+        """刪除 manifest 已不再引用的圖片檔，回傳刪除數量"""
+        referenced = {
+            self.object_path(entry["hash"], entry["ext"]).name
+            for entry in self.manifest["assets"].values()
+        }
+        removed = 0
+        if self.objects_dir.exists():
+            for path in self.objects_dir.iterdir():
+                if path.is_file() and path.name not in referenced:
+                    path.unlink()
+                    removed += 1
+        return removed
+
+    def get_path(self, key: str) -> Optional[Path]:
+        """取得圖片在磁碟上的路徑"""
+        entry = self.entry(key)
+        if entry is None:
+            return None
+        return self.object_path(entry["hash"], entry["ext"])
+
+    def get_bytes(self, key: str) -> Optional[bytes]:
+        """讀取圖片內容"""
+        path = self.get_path(key)
+        if path is None:
+            return None
+        try:
+            return path.read_bytes()
+        except Exception as e:
+            logger.error(f"讀取圖片 {key} 時發生錯誤：{str(e)}")
+            return None
+
+    def get_mime_type(self, key: str) -> str:
+        """取得圖片的 MIME 類型"""
+        entry = self.entry(key)
+        ext = entry["ext"] if entry else "png"
+        return mimetypes.guess_type(f"image.{ext}")[0] or f"image/{ext}"
+
+    def get_data_uri(self, key: str) -> str:
+        """產生 data URI，找不到圖片時回傳空字串"""
+        data = self.get_bytes(key)
+        if data is None:
+            return ""
+        encoded = base64.b64encode(data).decode('ascii')
+        return f"data:{self.get_mime_type(key)};base64,{encoded}"
+
+    def get_url(self, key: str) -> str:
+        """產生靜態檔案網址（需啟用 Streamlit static serving），找不到圖片時回傳空字串
+
+        檔名即內容雜湊，內容不會變動；加上 ?v= 參數後 tornado 會回傳長效
+        Cache-Control 與 ETag，瀏覽器重複瀏覽時不需再次下載。
+        """
+        entry = self.entry(key)
+        if entry is None:
+            return ""
+        return f"{self.url_prefix}/{entry['hash']}.{entry['ext']}?v={entry['hash'][:12]}"
+
+
+class ImageRegistry:
+    """執行期圖片註冊表：內容相同的鍵值共用同一份 buffer 與 data URI
+
+    圖片只在頁面第一次要求時才讀取，快取以 LRU 控制在 registry_cache_bytes
+    以內，由所有 session 共用，因此記憶體不會隨圖片總數成長。
+    """
+
+    def __init__(self, store: AssetStore, cache_bytes: Optional[int] = None):
+        self.store = store
+        self.variants = VariantCache(store)
+        self.cache_bytes = cache_bytes or ASSET_CONFIG["registry_cache_bytes"]
+        # (種類, 內容雜湊) -> bytes 或 data URI
+        self._cache: "OrderedDict[Tuple[str, str], Any]" = OrderedDict()
+        self._cached_bytes = 0
+        self._prefetched: Set[str] = set()
+        self._lock = threading.Lock()
+
+    def _cache_get(self, kind: str, digest: str) -> Any:
+        """讀取快取並標記為最近使用"""
+        with self._lock:
+            value = self._cache.get((kind, digest))
+            if value is not None:
+                self._cache.move_to_end((kind, digest))
+            return value
+
+    def _cache_put(self, kind: str, digest: str, value: Any) -> Any:
+        """寫入快取，超過上限時淘汰最久未使用的項目"""
+        with self._lock:
+            existing = self._cache.get((kind, digest))
+            if existing is not None:
+                return existing
+            self._cache[(kind, digest)] = value
+            self._cached_bytes += len(value)
+            while self._cached_bytes > self.cache_bytes and len(self._cache) > 1:
+                _, evicted = self._cache.popitem(last=False)
+                self._cached_bytes -= len(evicted)
+            return value
+
+    def resolve(self, key: str) -> Optional[str]:
+        """取得鍵值對應的內容雜湊"""
+        entry = self.store.entry(key)
+        return entry["hash"] if entry else None
+
+    def aliases(self, key: str) -> List[str]:
+        """列出與此鍵值內容相同的所有鍵值（包含自己）"""
+        digest = self.resolve(key)
+        if digest is None:
+            return []
+        return [k for k, entry in self.store.manifest["assets"].items() if entry["hash"] == digest]
+
+    def get_bytes(self, key: str) -> Optional[bytes]:
+        """讀取圖片內容，同一雜湊只讀取並保存一次"""
+        digest = self.resolve(key)
+        if digest is None:
+            return None
+        data = self._cache_get("bytes", digest)
+        if data is None:
+            data = self.store.get_bytes(key)
+            if data is None:
+                return None
+            data = self._cache_put("bytes", digest, data)
+        return data
+
+    def get_data_uri(self, key: str) -> str:
+        """產生 data URI，同一雜湊只編碼一次"""
+        digest = self.resolve(key)
+        if digest is None:
+            return ""
+        uri = self._cache_get("uri", digest)
+        if uri is None:
+            data = self.get_bytes(key)
+            if data is None:
+                return ""
+            encoded = base64.b64encode(data).decode('ascii')
+            uri = self._cache_put("uri", digest, f"data:{self.store.get_mime_type(key)};base64,{encoded}")
+        return uri
+
+    def get_url(self, key: str) -> str:
+        """產生靜態檔案網址"""
+        return self.store.get_url(key)
+
+    def get_src(self, key: str, box: Optional[int] = None) -> str:
+        """依 serve_mode 產生 <img src>：靜態網址或 data URI
+
+        指定 box（顯示尺寸 px）時優先使用最小的合適縮圖變體。
+        """
+        inline = ASSET_CONFIG["serve_mode"] == "inline"
+        if box is not None:
+            src = self.variants.get_data_uri(key, box) if inline else self.variants.get_url(key, box)
+            if src:
+                return src
+        return self.get_data_uri(key) if inline else self.get_url(key)
+
+    def img_tag(self, key: str, box: int, style: str = "", fallback: str = "") -> str:
+        """產生 box×box 的 <img> 標籤，找不到圖片時回傳 fallback"""
+        src = self.get_src(key, box)
+        if not src:
+            return fallback
+        extra = f" {style}" if style else ""
+        return f'<img src="{src}" style="width:{box}px; height:{box}px; object-fit:contain;{extra}">'
+
+    def collection(self, name: str) -> List[str]:
+        """取得分組下的鍵值"""
+        return self.store.collection(name)
+
+    def prefetch(self, page: str) -> None:
+        """在背景預先準備某頁面會用到的圖片，每個程序只執行一次"""
+        with self._lock:
+            if page in self._prefetched or page not in PAGE_ASSETS:
+                return
+            self._prefetched.add(page)
+        threading.Thread(target=self._warm, args=(PAGE_ASSETS[page],), daemon=True).start()
+
+    def _warm(self, assets: List[Tuple[str, int]]) -> None:
+        """產生縮圖變體（inline 模式下同時編碼 data URI）"""
+        for key, box in assets:
+            try:
+                self.get_src(key, box)
+            except Exception as e:
+                logger.error(f"預先載入圖片 {key} 時發生錯誤：{str(e)}")
+
+    def memory_usage(self) -> int:
+        """目前快取中的位元組數（buffer 加上 data URI）"""
+        return self._cached_bytes
+
+
+def import_image_dict(store: AssetStore, images: Dict[str, Any]) -> int:
+    """匯入舊版 base64 圖片字典，回傳匯入張數
+
+    支援兩種格式：
+    - LLM_IMAGES：{key: {"filename", "ext", "base64", ...}}
+    - LICENSE_IMAGES：{category: [{"ext", "base64"}, ...]}，以 category 為分組
+    """
+    count = 0
+    for name, value in images.items():
+        if isinstance(value, dict):
+            data = base64.b64decode(value["base64"])
+            store.put(name, data, value.get("ext", "png"), filename=value.get("filename"))
+            count += 1
+        else:
+            for index, item in enumerate(value, start=1):
+                data = base64.b64decode(item["base64"])
+                store.put(f"{name}_{index}", data, item.get("ext", "png"),
+                          filename=item.get("filename"), collection=name)
+                count += 1
+    return count
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="將 base64 圖片模組匯入內容雜湊資源庫")
+    parser.add_argument(
+        "sources", nargs="+",
+        help="module:ATTR，例如 llm_images_data:LLM_IMAGES license_images_data:LICENSE_IMAGES"
+    )
+    args = parser.parse_args(argv)
+
+    store = AssetStore()
+    for source in args.sources:
+        module_name, _, attr = source.partition(':')
+        images = getattr(importlib.import_module(module_name), attr)
+        count = import_image_dict(store, images)
+        print(f"{source}: 匯入 {count} 張圖片")
+    removed = store.prune()
+    store.save_manifest()
+    stats = store.manifest["dedup"]
+    print(
+        f"去重：{stats['total_keys']} 個鍵值對應 {stats['unique_objects']} 個檔案，"
+        f"{len(stats['aliases'])} 個別名，節省 {stats['saved_bytes']} bytes"
+    )
+    if removed:
+        print(f"已刪除 {removed} 個未引用的檔案")
+    print(f"manifest 已寫入 {store.manifest_path}")
+
+
+def get_image(key: str) -> Optional[bytes]:
+    """依鍵值取得圖片內容，第一次要求時才從磁碟讀取"""
+    return image_registry.get_bytes(key)
+
+
+# 創建單例實例
+asset_store = AssetStore()
+image_registry = ImageRegistry(asset_store)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,164 @@
+import argparse
+import ast
+import hashlib
+import logging
+import re
+import shutil
+import subprocess
+import tempfile
+import threading
+from pathlib import Path
+from typing import Dict, List, Optional, Set
+
+import streamlit as st
+
+from config import BASE_DIR, DIAGRAM_CONFIG
+
+logger = logging.getLogger(__name__)
+
+# 以這些關鍵字開頭的字串常數視為 Mermaid 原始碼（供離線預先渲染掃描）
+MERMAID_KEYWORDS = ("graph", "flowchart", "sequenceDiagram", "classDiagram",
+                    "stateDiagram", "erDiagram", "gantt", "pie", "mindmap", "timeline")
+
+# 關閉 HTML 標籤，讓文字以 SVG <text> 輸出，以 <img> 顯示時才不會遺失
+INIT_DIRECTIVE = '%%{init: {"flowchart": {"htmlLabels": false}}}%%\n'
+
+# mmdc 輸出的 SVG 寬度為 100%，自然寬度記錄在 max-width 樣式或 viewBox 中
+SVG_MAX_WIDTH = re.compile(r'max-width:\s*([0-9.]+)px')
+SVG_VIEWBOX = re.compile(r'viewBox="[-0-9.]+[\s,]+[-0-9.]+[\s,]+([0-9.]+)')
+
+
+class DiagramCache:
+    """將 Mermaid 原始碼渲染成 SVG 並以原始碼雜湊快取在磁碟上"""
+
+    def __init__(self, cache_dir: Optional[Path] = None):
+        self.cache_dir = Path(cache_dir or DIAGRAM_CONFIG["cache_dir"])
+        self._svgs: Dict[str, str] = {}
+        self._pending: Set[str] = set()
+        self._failed: Set[str] = set()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def digest(source: str) -> str:
+        """原始碼雜湊（快取鍵值）"""
+        return hashlib.sha256((INIT_DIRECTIVE + source).encode('utf-8')).hexdigest()
+
+    def svg_path(self, source: str) -> Path:
+        """取得 SVG 快取檔路徑"""
+        return self.cache_dir / f"{self.digest(source)}.svg"
+
+    def get_svg(self, source: str, render: bool = True) -> Optional[str]:
+        """取得快取的 SVG；尚未渲染時在背景排程渲染並回傳 None"""
+        digest = self.digest(source)
+        svg = self._svgs.get(digest)
+        if svg is not None:
+            return svg
+
+        path = self.svg_path(source)
+        if path.exists():
+            svg = path.read_text(encoding='utf-8')
+            self._svgs[digest] = svg
+            return svg
+
+        if render:
+            with self._lock:
+                if digest in self._pending or digest in self._failed:
+                    return None
+                self._pending.add(digest)
+            threading.Thread(target=self._render_in_background, args=(source,), daemon=True).start()
+        return None
+
+    def _render_in_background(self, source: str) -> None:
+        digest = self.digest(source)
+        try:
+            if self.render(source) is None:
+                self._failed.add(digest)
+        finally:
+            self._pending.discard(digest)
+
+    def render(self, source: str) -> Optional[Path]:
+        """以 mermaid-cli (mmdc) 渲染 SVG 並寫入快取，無法渲染時回傳 None"""
+        mmdc = shutil.which(DIAGRAM_CONFIG["mmdc_path"])
+        if mmdc is None:
+            logger.info("找不到 mmdc，Mermaid 圖表改由瀏覽器端渲染")
+            return None
+
+        path = self.svg_path(source)
+        try:
+            with tempfile.TemporaryDirectory() as tmp_dir:
+                input_path = Path(tmp_dir) / "diagram.mmd"
+                output_path = Path(tmp_dir) / "diagram.svg"
+                input_path.write_text(INIT_DIRECTIVE + source, encoding='utf-8')
+                subprocess.run(
+                    [mmdc, "-i", str(input_path), "-o", str(output_path), "-b", "transparent"],
+                    check=True, capture_output=True, timeout=DIAGRAM_CONFIG["render_timeout"]
+                )
+                path.parent.mkdir(parents=True, exist_ok=True)
+                shutil.move(str(output_path), str(path))
+            return path
+        except Exception as e:
+            logger.error(f"渲染 Mermaid 圖表時發生錯誤：{str(e)}")
+            return None
+
+
+def find_diagrams(paths: List[Path]) -> List[str]:
+    """掃描 Python 檔案中的 Mermaid 原始碼字串常數"""
+    sources = []
+    for path in paths:
+        try:
+            tree = ast.parse(path.read_text(encoding='utf-8'), filename=str(path))
+        except SyntaxError as e:
+            logger.warning(f"略過無法解析的檔案 {path}：{str(e)}")
+            continue
+        for node in ast.walk(tree):
+            if isinstance(node, ast.Constant) and isinstance(node.value, str):
+                words = node.value.split(None, 1)
+                if words and words[0] in MERMAID_KEYWORDS and node.value not in sources:
+                    sources.append(node.value)
+    return sources
+
+
+def svg_width(svg: str) -> Optional[int]:
+    """取得 SVG 的自然寬度（像素），無法判斷時回傳 None"""
+    match = SVG_MAX_WIDTH.search(svg) or SVG_VIEWBOX.search(svg)
+    return int(round(float(match.group(1)))) if match else None
+
+
+def render_mermaid(source: str) -> None:
+    """顯示 Mermaid 圖表：有快取 SVG 時直接嵌入，否則退回瀏覽器端 st_mermaid"""
+    svg = diagram_cache.get_svg(source)
+    if svg is not None:
+        # 以原始寬度顯示，避免窄長的直式圖表被拉伸到整個欄寬
+        width = svg_width(svg)
+        if width is None:
+            st.image(svg, use_container_width=True)
+        else:
+            st.image(svg, width=width)
+        return
+
+    from streamlit_mermaid import st_mermaid
+    st_mermaid(source)
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="離線預先渲染頁面中的 Mermaid 圖表")
+    parser.add_argument("paths", nargs="*", help="要掃描的 Python 檔案（預設為所有頁面）")
+    args = parser.parse_args(argv)
+
+    paths = [Path(p) for p in args.paths] or [
+        path for pattern in ("*.py", "pages/*.py", "sections/*.py") for path in sorted(BASE_DIR.glob(pattern))
+    ]
+    cache = DiagramCache()
+    rendered = 0
+    sources = find_diagrams(paths)
+    for source in sources:
+        if cache.svg_path(source).exists() or cache.render(source) is not None:
+            rendered += 1
+    print(f"{rendered}/{len(sources)} 個圖表已渲染於 {cache.cache_dir}")
+
+
+# 創建單例實例
+diagram_cache = DiagramCache()
+
+if __name__ == '__main__':
+    main()
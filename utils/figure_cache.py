@@ -0,0 +1,66 @@
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+from types import CodeType
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from config import CHART_CONFIG
+
+
+class FigureCache:
+    """靜態圖表快取：同一份輸入資料的圖表每個程序只建構一次
+
+    建構 px/go 圖表（約數十毫秒）遠比 Streamlit 送出前的序列化昂貴，因此快取
+    建好的 Figure 物件；呼叫端只讀取，不可再修改回傳的圖表。
+    """
+
+    def __init__(self, max_entries: Optional[int] = None):
+        self.max_entries = max_entries or CHART_CONFIG["figure_cache_size"]
+        self._figures: "OrderedDict[str, Any]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def code_digest(code: CodeType) -> str:
+        """建構函數位元組碼與常數的雜湊；修改建構函數後鍵值隨之改變，不會沿用舊圖表"""
+        sha = hashlib.sha256(code.co_code)
+        for const in code.co_consts:
+            # 巢狀函數（如 lambda）遞迴處理，避免 repr 中的記憶體位址讓每次重新執行都不同
+            sha.update((FigureCache.code_digest(const) if isinstance(const, CodeType) else repr(const)).encode('utf-8'))
+        return sha.hexdigest()
+
+    @classmethod
+    def make_key(cls, builder: Callable, args: Tuple, kwargs: Dict[str, Any]) -> str:
+        """以建構函數（名稱與程式碼）與輸入資料產生快取鍵值"""
+        payload = json.dumps([cls.code_digest(builder.__code__), args, kwargs],
+                             sort_keys=True, ensure_ascii=False, default=str)
+        digest = hashlib.sha256(payload.encode('utf-8')).hexdigest()
+        # 以模組與限定名稱區分同名的建構函數；Streamlit 頁面都以 __main__ 執行，改用檔案路徑區分
+        module = builder.__module__
+        if module == '__main__':
+            module = builder.__code__.co_filename
+        return f"{module}.{builder.__qualname__}:{digest}"
+
+    def get(self, builder: Callable, *args, **kwargs) -> Any:
+        """取得快取圖表，沒有時呼叫 builder(*args, **kwargs) 建構"""
+        key = self.make_key(builder, args, kwargs)
+        with self._lock:
+            fig = self._figures.get(key)
+            if fig is not None:
+                self._figures.move_to_end(key)
+                self.hits += 1
+                return fig
+
+        fig = builder(*args, **kwargs)
+        with self._lock:
+            self.misses += 1
+            fig = self._figures.setdefault(key, fig)
+            while len(self._figures) > self.max_entries:
+                self._figures.popitem(last=False)
+        return fig
+
+
+# 創建單例實例
+figure_cache = FigureCache()
@@ -0,0 +1,342 @@
+import argparse
+import csv
+import ipaddress
+import json
+import logging
+import os
+import tempfile
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+import requests
+
+from config import GEO_CONFIG
+
+logger = logging.getLogger(__name__)
+
+UNKNOWN_LOCATION = {"country": "unknown", "city": "unknown", "org": "unknown"}
+
+
+def is_public_ip(ip: Optional[str]) -> bool:
+    """只有公開位址才值得查詢地理位置"""
+    try:
+        return ipaddress.ip_address(ip).is_global
+    except ValueError:
+        return False
+
+
+class GeoCache:
+    """以 IP 為鍵的 LRU + TTL 快取，持久化為 JSON 檔"""
+
+    def __init__(self, path: Optional[Path] = None, ttl: Optional[float] = None,
+                 max_entries: Optional[int] = None):
+        self.path = Path(path or GEO_CONFIG["cache_path"])
+        self.ttl = GEO_CONFIG["cache_ttl"] if ttl is None else ttl
+        self.max_entries = max_entries or GEO_CONFIG["cache_max_entries"]
+        # IP -> (寫入時間, 地理位置)，越後面越近期使用
+        self._entries: "OrderedDict[str, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+        self._lock = threading.Lock()
+        # 同一行程內的多個執行緒依序寫檔，較舊的快照不會覆蓋較新的
+        self._save_lock = threading.Lock()
+        self._dirty = False
+        self._load()
+
+    def _load(self) -> None:
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                raw = json.load(f)
+        except FileNotFoundError:
+            return
+        except Exception as e:
+            logger.error(f"讀取地理位置快取時發生錯誤：{str(e)}")
+            return
+        now = time.time()
+        for ip, (stored_at, location) in raw.items():
+            if now - stored_at < self.ttl:
+                self._entries[ip] = (stored_at, location)
+        self._trim()
+
+    def _trim(self) -> None:
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self._dirty = True
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, ip: str) -> Optional[Dict[str, Any]]:
+        """取得未過期的快取結果，並標記為最近使用"""
+        with self._lock:
+            entry = self._entries.get(ip)
+            if entry is None:
+                return None
+            if time.time() - entry[0] >= self.ttl:
+                del self._entries[ip]
+                self._dirty = True
+                return None
+            self._entries.move_to_end(ip)
+            return entry[1]
+
+    def put_many(self, locations: Dict[str, Dict[str, Any]]) -> None:
+        """寫入多筆結果，超過上限時淘汰最久未使用的 IP"""
+        if not locations:
+            return
+        now = time.time()
+        with self._lock:
+            for ip, location in locations.items():
+                self._entries[ip] = (now, location)
+                self._entries.move_to_end(ip)
+            self._dirty = True
+            self._trim()
+
+    def save(self) -> None:
+        """有變更時以暫存檔 + 原子替換寫回磁碟"""
+        with self._save_lock:
+            with self._lock:
+                if not self._dirty:
+                    return
+                snapshot = dict(self._entries)
+                self._dirty = False
+            tmp_path = None
+            try:
+                # 每次寫入使用唯一的暫存檔，其他行程同時寫入也不會互相覆蓋內容
+                with tempfile.NamedTemporaryFile('w', encoding='utf-8', dir=self.path.parent,
+                                                 prefix=f"{self.path.name}.", suffix='.tmp', delete=False) as f:
+                    tmp_path = f.name
+                    json.dump(snapshot, f, ensure_ascii=False)
+                os.replace(tmp_path, self.path)
+            except Exception as e:
+                logger.error(f"儲存地理位置快取時發生錯誤：{str(e)}")
+                if tmp_path is not None and os.path.exists(tmp_path):
+                    os.unlink(tmp_path)
+
+
+class GeoResolver(ABC):
+    """地理位置查詢介面：回傳查得到的 IP，查不到的不放進結果"""
+
+    @abstractmethod
+    def resolve(self, ips: List[str]) -> Dict[str, Dict[str, Any]]:
+        ...
+
+
+class CidrResolver(GeoResolver):
+    """離線 CIDR 對照表，最長前綴優先，每個 IP 只需查幾次字典"""
+
+    def __init__(self, networks: Iterable[Tuple[str, Dict[str, Any]]]):
+        # (IP 版本, 前綴長度) -> {網段起始位址 >> 主機位元數: 地理位置}
+        self._tables: Dict[Tuple[int, int], Dict[int, Dict[str, Any]]] = {}
+        for cidr, location in networks:
+            network = ipaddress.ip_network(cidr, strict=False)
+            key = int(network.network_address) >> (network.max_prefixlen - network.prefixlen)
+            self._tables.setdefault((network.version, network.prefixlen), {})[key] = location
+        self._prefixes = {
+            version: sorted((plen for v, plen in self._tables if v == version), reverse=True)
+            for version in (4, 6)
+        }
+
+    @classmethod
+    def from_csv(cls, path: Path) -> "CidrResolver":
+        """從 cidr,country,city,org 格式的 CSV 載入"""
+        with open(path, 'r', encoding='utf-8', newline='') as f:
+            rows = list(csv.DictReader(f))
+        return cls(
+            (row["cidr"], {field: row.get(field) or "unknown" for field in ("country", "city", "org")})
+            for row in rows
+        )
+
+    def lookup(self, ip: str) -> Optional[Dict[str, Any]]:
+        try:
+            address = ipaddress.ip_address(ip)
+        except ValueError:
+            return None
+        value = int(address)
+        for plen in self._prefixes[address.version]:
+            location = self._tables[(address.version, plen)].get(value >> (address.max_prefixlen - plen))
+            if location is not None:
+                return location
+        return None
+
+    def resolve(self, ips: List[str]) -> Dict[str, Dict[str, Any]]:
+        results = {}
+        for ip in ips:
+            location = self.lookup(ip)
+            if location is not None:
+                results[ip] = location
+        return results
+
+
+class IpApiResolver(GeoResolver):
+    """ip-api 批次查詢：每批最多 batch_size 個 IP，多批由執行緒池並行送出，並遵守每分鐘的請求上限"""
+
+    def __init__(self, batch_url: Optional[str] = None, batch_size: Optional[int] = None,
+                 max_workers: Optional[int] = None, timeout: Optional[float] = None,
+                 rate_limit: Optional[int] = None, rate_window: Optional[float] = None,
+                 max_wait: Optional[float] = None):
+        self.batch_url = batch_url or GEO_CONFIG["batch_url"]
+        self.batch_size = batch_size or GEO_CONFIG["batch_size"]
+        self.max_workers = max_workers or GEO_CONFIG["max_workers"]
+        self.timeout = timeout or GEO_CONFIG["timeout"]
+        self.rate_limit = rate_limit or GEO_CONFIG["rate_limit"]
+        self.rate_window = rate_window or GEO_CONFIG["rate_window"]
+        self.max_wait = GEO_CONFIG["max_wait"] if max_wait is None else max_wait
+        # 目前時間窗內還能送出的請求數與時間窗結束時刻（monotonic），由回應標頭校正
+        self._remaining = self.rate_limit
+        self._reset_at = 0.0
+        self._rate_lock = threading.Lock()
+
+    def _acquire(self, deadline: float) -> bool:
+        """取得一次請求額度，額度用完時等到時間窗重置；超過 deadline 回傳 False"""
+        while True:
+            with self._rate_lock:
+                now = time.monotonic()
+                if now >= self._reset_at:
+                    self._remaining = self.rate_limit
+                    self._reset_at = now + self.rate_window
+                if self._remaining > 0:
+                    self._remaining -= 1
+                    return True
+                wait = self._reset_at - now
+            if now + wait > deadline:
+                return False
+            time.sleep(wait)
+
+    def _update_limit(self, response: requests.Response) -> None:
+        """依 X-Rl（剩餘請求數）與 X-Ttl（重置秒數）校正額度；429 時視為額度用完"""
+        remaining = response.headers.get("X-Rl")
+        ttl = response.headers.get("X-Ttl")
+        with self._rate_lock:
+            if remaining is not None:
+                self._remaining = min(self._remaining, int(remaining))
+            if response.status_code == 429:
+                self._remaining = 0
+            if ttl is not None:
+                self._reset_at = time.monotonic() + int(ttl)
+            elif response.status_code == 429:
+                self._reset_at = time.monotonic() + self.rate_window
+
+    def _query_batch(self, ips: List[str], deadline: float) -> Dict[str, Dict[str, Any]]:
+        while self._acquire(deadline):
+            try:
+                response = requests.post(self.batch_url, json=ips, timeout=self.timeout)
+                self._update_limit(response)
+                if response.status_code == 429:
+                    continue
+                response.raise_for_status()
+                items = response.json()
+            except Exception as e:
+                # 這一批留待下次再查，不寫入快取
+                logger.error(f"批次查詢 {len(ips)} 個 IP 位置時發生錯誤：{str(e)}")
+                return {}
+            return {
+                item["query"]: {field: item.get(field) or "unknown" for field in ("country", "city", "org")}
+                for item in items
+                if item.get("status") == "success"
+            }
+        logger.warning(f"ip-api 請求額度已用完，{len(ips)} 個 IP 留待下次查詢")
+        return {}
+
+    def resolve(self, ips: List[str]) -> Dict[str, Dict[str, Any]]:
+        batches = [ips[i:i + self.batch_size] for i in range(0, len(ips), self.batch_size)]
+        if not batches:
+            return {}
+        deadline = time.monotonic() + self.max_wait
+        results: Dict[str, Dict[str, Any]] = {}
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(batches))) as pool:
+            for found in pool.map(lambda batch: self._query_batch(batch, deadline), batches):
+                results.update(found)
+        return results
+
+
+class Geolocator:
+    """依序查詢離線對照表、快取、線上服務；只有線上結果會寫入快取"""
+
+    def __init__(self, offline: Optional[GeoResolver] = None, online: Optional[GeoResolver] = None,
+                 cache: Optional[GeoCache] = None):
+        self.offline = offline
+        self.online = online
+        self.cache = cache
+
+    def locate_many(self, ips: Iterable[str]) -> Dict[str, Dict[str, Any]]:
+        """查詢多個 IP 的地理位置，查不到的回傳 unknown"""
+        ips = list(dict.fromkeys(ips))
+        results: Dict[str, Dict[str, Any]] = {}
+        pending = [ip for ip in ips if is_public_ip(ip)]
+
+        if self.offline is not None and pending:
+            results.update(self.offline.resolve(pending))
+            pending = [ip for ip in pending if ip not in results]
+
+        if self.cache is not None:
+            misses = []
+            for ip in pending:
+                location = self.cache.get(ip)
+                if location is None:
+                    misses.append(ip)
+                else:
+                    results[ip] = location
+            pending = misses
+
+        if self.online is not None and pending:
+            found = self.online.resolve(pending)
+            results.update(found)
+            if self.cache is not None:
+                self.cache.put_many(found)
+                self.cache.save()
+
+        return {ip: results.get(ip, UNKNOWN_LOCATION) for ip in ips}
+
+    def is_known(self, ip: str) -> bool:
+        """離線對照表或快取中已有此 IP，不需要再線上查詢"""
+        if self.offline is not None and self.offline.resolve([ip]):
+            return True
+        return self.cache is not None and self.cache.get(ip) is not None
+
+    def locate(self, ip: str) -> Dict[str, Any]:
+        """查詢單一 IP 的地理位置"""
+        return self.locate_many([ip])[ip]
+
+
+def create_geolocator(online: Optional[bool] = None) -> Geolocator:
+    """依 GEO_CONFIG 組合離線對照表、線上服務與快取"""
+    offline = None
+    cidr_path = Path(GEO_CONFIG["cidr_table_path"])
+    if cidr_path.exists():
+        try:
+            offline = CidrResolver.from_csv(cidr_path)
+        except Exception as e:
+            logger.error(f"載入 CIDR 對照表時發生錯誤：{str(e)}")
+    online = GEO_CONFIG["online"] if online is None else online
+    return Geolocator(offline=offline, online=IpApiResolver() if online else None, cache=GeoCache())
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="查詢 IP 地理位置")
+    parser.add_argument("ips", nargs="*", help="要查詢的 IP")
+    parser.add_argument("--file", help="每行一個 IP 的檔案")
+    parser.add_argument("--offline", action="store_true", help="只使用離線對照表與快取")
+    args = parser.parse_args(argv)
+
+    ips = list(args.ips)
+    if args.file:
+        with open(args.file, 'r', encoding='utf-8') as f:
+            ips.extend(line.strip() for line in f if line.strip())
+
+    locator = create_geolocator(online=False) if args.offline else geolocator
+    start = time.perf_counter()
+    locations = locator.locate_many(ips)
+    elapsed = time.perf_counter() - start
+    for ip, location in locations.items():
+        print(f"{ip}\t{location['city']}, {location['country']}\t{location['org']}")
+    print(f"共 {len(locations)} 個 IP，耗時 {elapsed:.2f} 秒")
+
+
+# 創建單例實例
+geolocator = create_geolocator()
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,127 @@
+import argparse
+import base64
+import logging
+import threading
+from pathlib import Path
+from typing import List, Optional, Set, Tuple
+
+from config import ASSET_CONFIG
+
+logger = logging.getLogger(__name__)
+
+
+class VariantCache:
+    """以 Pillow 產生縮圖變體（依顯示尺寸），第一次使用時寫入磁碟快取"""
+
+    def __init__(self, store, variants_dir: Optional[Path] = None):
+        self.store = store
+        self.variants_dir = Path(variants_dir or ASSET_CONFIG["variants_dir"])
+        self.url_prefix = ASSET_CONFIG["variant_url_prefix"]
+        self.sizes = sorted(ASSET_CONFIG["variant_sizes"])
+        self.scale = ASSET_CONFIG["variant_scale"]
+        self.format = ASSET_CONFIG["variant_format"]
+        # 原圖已經夠小（或縮圖反而更大）的組合，直接使用原圖
+        self._use_original: Set[Tuple[str, int]] = set()
+        self._lock = threading.Lock()
+
+    def pick_size(self, box: int) -> Optional[int]:
+        """選出不小於顯示框的最小變體尺寸，沒有合適尺寸時回傳 None"""
+        for size in self.sizes:
+            if size >= box:
+                return size
+        return None
+
+    def variant_path(self, digest: str, size: int) -> Path:
+        """取得變體檔案路徑"""
+        return self.variants_dir / f"{digest}_{size}.{self.format}"
+
+    def ensure(self, key: str, box: int) -> Optional[Path]:
+        """取得（必要時產生）符合顯示框的變體，應使用原圖時回傳 None"""
+        size = self.pick_size(box)
+        entry = self.store.entry(key)
+        if size is None or entry is None:
+            return None
+
+        digest = entry["hash"]
+        path = self.variant_path(digest, size)
+        if path.exists():
+            return path
+        if (digest, size) in self._use_original:
+            return None
+
+        with self._lock:
+            if path.exists():
+                return path
+            try:
+                if self._generate(self.store.get_path(key), path, size * self.scale, entry["size"]):
+                    return path
+            except Exception as e:
+                logger.error(f"產生圖片變體 {key}@{size} 時發生錯誤：{str(e)}")
+            self._use_original.add((digest, size))
+            return None
+
+    def _generate(self, source: Path, target: Path, pixels: int, original_size: int) -> bool:
+        """縮圖並寫入變體檔，若不比原圖小則不寫入"""
+        # 只有真的要產生變體時才載入 Pillow
+        from PIL import Image
+
+        with Image.open(source) as img:
+            if max(img.size) <= pixels:
+                return False
+            img.thumbnail((pixels, pixels), Image.LANCZOS)
+            target.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = target.with_suffix(target.suffix + '.tmp')
+            img.save(tmp_path, format=self.format.upper(), quality=85, method=6)
+
+        if tmp_path.stat().st_size >= original_size:
+            tmp_path.unlink()
+            return False
+        tmp_path.replace(target)
+        return True
+
+    def get_url(self, key: str, box: int) -> str:
+        """變體的靜態網址，應使用原圖時回傳空字串"""
+        path = self.ensure(key, box)
+        if path is None:
+            return ""
+        # 檔名已包含內容雜湊與尺寸，?v= 讓 tornado 回傳長效快取標頭
+        return f"{self.url_prefix}/{path.name}?v={path.stem[:12]}"
+
+    def get_data_uri(self, key: str, box: int) -> str:
+        """變體的 data URI，應使用原圖時回傳空字串"""
+        path = self.ensure(key, box)
+        if path is None:
+            return ""
+        encoded = base64.b64encode(path.read_bytes()).decode('ascii')
+        return f"data:image/{self.format};base64,{encoded}"
+
+    def build_all(self, keys: Optional[List[str]] = None) -> int:
+        """預先產生所有鍵值、所有尺寸的變體，回傳產生的檔案數"""
+        count = 0
+        seen: Set[str] = set()
+        for key in keys or self.store.keys():
+            # 內容相同的別名只需處理一次
+            digest = self.store.entry(key)["hash"]
+            if digest in seen:
+                continue
+            seen.add(digest)
+            for size in self.sizes:
+                if self.ensure(key, size) is not None:
+                    count += 1
+        return count
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="預先產生圖片縮圖變體")
+    parser.add_argument("keys", nargs="*", help="只處理指定鍵值（預設全部）")
+    args = parser.parse_args(argv)
+
+    from utils.asset_store import asset_store
+
+    cache = VariantCache(asset_store)
+    count = cache.build_all(args.keys or None)
+    print(f"已產生 {count} 個變體於 {cache.variants_dir}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,79 @@
+import logging
+import queue
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional, Set
+
+from config import GEO_CONFIG
+from .geolocation import geolocator, is_public_ip
+
+logger = logging.getLogger(__name__)
+
+
+class EnrichmentQueue:
+    """背景工作佇列：在渲染流程之外補充 IP 資訊，submit 永遠不會阻塞；排隊中的 IP 一次整批查詢"""
+
+    def __init__(self, enrich: Callable[[List[str]], Dict[str, Dict[str, Any]]],
+                 is_known: Optional[Callable[[str], bool]] = None,
+                 max_size: Optional[int] = None, batch_size: Optional[int] = None):
+        # 查詢結果由 enrich 自行保存（地理位置快取），佇列只記得還在排隊的 IP
+        self.enrich = enrich
+        self.is_known = is_known
+        self.batch_size = batch_size or GEO_CONFIG["batch_size"]
+        self._queue: "queue.Queue[str]" = queue.Queue(maxsize=max_size or GEO_CONFIG["queue_size"])
+        self._pending: Set[str] = set()
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+
+    def submit(self, ip: Optional[str]) -> bool:
+        """排入待查詢的 IP，已查過、正在排隊或佇列已滿時直接略過"""
+        if not is_public_ip(ip):
+            return False
+        if self.is_known is not None and self.is_known(ip):
+            return False
+        with self._lock:
+            if ip in self._pending:
+                return False
+            self._pending.add(ip)
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._run, name="ip-enrichment", daemon=True)
+                self._thread.start()
+        try:
+            self._queue.put_nowait(ip)
+            return True
+        except queue.Full:
+            logger.warning(f"IP 查詢佇列已滿，略過 {ip}")
+            with self._lock:
+                self._pending.discard(ip)
+            return False
+
+    def _run(self) -> None:
+        while True:
+            batch = [self._queue.get()]
+            while len(batch) < self.batch_size:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            try:
+                self.enrich(batch)
+            except Exception as e:
+                logger.error(f"查詢 {len(batch)} 個 IP 資訊時發生錯誤：{str(e)}")
+            # 查不到的 IP 不會進入快取，之後可以再排入
+            with self._lock:
+                self._pending.difference_update(batch)
+            for _ in batch:
+                self._queue.task_done()
+
+    def wait(self, timeout: float) -> bool:
+        """等待佇列清空（報告或測試用），逾時回傳 False"""
+        deadline = time.monotonic() + timeout
+        while self._queue.unfinished_tasks:
+            if time.monotonic() >= deadline:
+                return False
+            time.sleep(0.05)
+        return True
+
+
+# 創建單例實例
+ip_enrichment = EnrichmentQueue(geolocator.locate_many, geolocator.is_known)
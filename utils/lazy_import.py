@@ -0,0 +1,145 @@
+import importlib
+import importlib.abc
+import logging
+import sys
+import threading
+import time
+import types
+from typing import Any, Callable, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+# 每次實際載入的記錄：{"module", "self_us", "cumulative_us", "depth", "trigger"}
+_import_records: List[Dict[str, Any]] = []
+_records_lock = threading.RLock()
+
+
+class _TimingLoader(importlib.abc.Loader):
+    """包裝原本的 loader，量測 exec_module 的時間（與 -X importtime 相同的 self/cumulative）"""
+
+    def __init__(self, loader, profiler: "_ImportProfiler"):
+        self._loader = loader
+        self._profiler = profiler
+
+    def create_module(self, spec):
+        return self._loader.create_module(spec)
+
+    def exec_module(self, module):
+        profiler = self._profiler
+        depth = len(profiler.stack)
+        profiler.stack.append(0.0)
+        start = time.perf_counter()
+        try:
+            self._loader.exec_module(module)
+        finally:
+            # 還原原本的 loader，避免影響依 loader 型別判斷的套件
+            module.__loader__ = self._loader
+            if module.__spec__ is not None:
+                module.__spec__.loader = self._loader
+            cumulative = time.perf_counter() - start
+            children = profiler.stack.pop()
+            if profiler.stack:
+                profiler.stack[-1] += cumulative
+            profiler.records.append({
+                "module": module.__name__,
+                "self_us": int((cumulative - children) * 1e6),
+                "cumulative_us": int(cumulative * 1e6),
+                "depth": depth
+            })
+
+    def __getattr__(self, name):
+        return getattr(self._loader, name)
+
+
+class _ImportProfiler(importlib.abc.MetaPathFinder):
+    """暫時插在 sys.meta_path 最前面，記錄這段期間新載入的每個模組"""
+
+    def __init__(self):
+        self.thread_id = threading.get_ident()
+        self.stack: List[float] = []
+        self.records: List[Dict[str, Any]] = []
+
+    def find_spec(self, fullname, path, target=None):
+        # 只記錄發起 import 的執行緒，其他 session 的 import 照常交給後面的 finder
+        if threading.get_ident() != self.thread_id:
+            return None
+        for finder in sys.meta_path:
+            if finder is self or not hasattr(finder, "find_spec"):
+                continue
+            spec = finder.find_spec(fullname, path, target)
+            if spec is not None:
+                if spec.loader is not None and hasattr(spec.loader, "exec_module"):
+                    spec.loader = _TimingLoader(spec.loader, self)
+                return spec
+        return None
+
+    def __enter__(self):
+        sys.meta_path.insert(0, self)
+        return self
+
+    def __exit__(self, *exc):
+        sys.meta_path.remove(self)
+        return False
+
+
+def timed_import(name: str, trigger: Optional[str] = None) -> types.ModuleType:
+    """import 模組並記錄其（含子模組）載入時間"""
+    with _records_lock:
+        if name in sys.modules:
+            return sys.modules[name]
+        with _ImportProfiler() as profiler:
+            module = importlib.import_module(name)
+        for record in profiler.records:
+            record["trigger"] = trigger or name
+            _import_records.append(record)
+    total = sum(r["self_us"] for r in profiler.records)
+    logger.info(f"延遲載入 {name}：{len(profiler.records)} 個模組，{total / 1000:.1f} ms")
+    return module
+
+
+class LazyModule(types.ModuleType):
+    """第一次存取屬性時才真正 import 的模組代理"""
+
+    def __init__(self, name: str, on_load: Optional[Callable[[types.ModuleType], None]] = None):
+        super().__init__(name)
+        self.__dict__["_lazy_on_load"] = on_load
+        self.__dict__["_lazy_module"] = None
+
+    def _load(self) -> types.ModuleType:
+        module = self.__dict__["_lazy_module"]
+        if module is None:
+            module = timed_import(self.__name__)
+            on_load = self.__dict__["_lazy_on_load"]
+            if on_load is not None:
+                on_load(module)
+            self.__dict__["_lazy_module"] = module
+        return module
+
+    def __getattr__(self, attr: str) -> Any:
+        return getattr(self._load(), attr)
+
+    def __dir__(self):
+        return dir(self._load())
+
+
+def lazy_import(name: str, on_load: Optional[Callable[[types.ModuleType], None]] = None) -> LazyModule:
+    """回傳延遲載入的模組；on_load 會在實際載入後呼叫一次（例如設定字型）"""
+    return LazyModule(name, on_load)
+
+
+def import_report(top: Optional[int] = None) -> List[Dict[str, Any]]:
+    """依 self 時間排序的載入記錄"""
+    with _records_lock:
+        records = sorted(_import_records, key=lambda r: r["self_us"], reverse=True)
+    return records[:top] if top else records
+
+
+def format_import_report(top: int = 20) -> str:
+    """以 -X importtime 的格式輸出最耗時的模組"""
+    lines = ["import time: self [us] | cumulative | imported package"]
+    for record in import_report(top):
+        lines.append(
+            f"import time: {record['self_us']:>9} | {record['cumulative_us']:>10} | "
+            f"{'  ' * record['depth']}{record['module']}  ({record['trigger']})"
+        )
+    return "\n".join(lines)
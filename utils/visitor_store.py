@@ -0,0 +1,473 @@
+import atexit
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+import uuid
+from abc import ABC, abstractmethod
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Set, Tuple
+
+from config import DB_CONFIG
+
+try:
+    import fcntl
+except ImportError:  # Windows 沒有 fcntl，只能以執行緒鎖保護
+    fcntl = None
+
+logger = logging.getLogger(__name__)
+
+
+class VisitorStore(ABC):
+    """訪問統計的儲存後端介面"""
+
+    @abstractmethod
+    def record_visit(self, ip: Optional[str] = None) -> int:
+        """記錄一次訪問並回傳總訪問量"""
+        ...
+
+    @abstractmethod
+    def add_counts(self, daily_visits: Dict[str, int], ips: Dict[str, Set[str]]) -> int:
+        """一次寫入多筆累計的訪問量與 IP，回傳新的總訪問量"""
+        ...
+
+    @abstractmethod
+    def total_visits(self) -> int:
+        """總訪問量"""
+        ...
+
+    @abstractmethod
+    def daily_report(self, date: str) -> Dict[str, Any]:
+        """指定日期的統計：total_visits、daily_visits、ips"""
+        ...
+
+    def compact(self) -> int:
+        """整理尚未併入的資料，回傳處理的事件數"""
+        return 0
+
+
+class JsonVisitorStore(VisitorStore):
+    """visitor_data.json 快照加上只追加的事件日誌"""
+
+    def __init__(self, data_file: Optional[Path] = None, log_file: Optional[Path] = None):
+        self.data_file = Path(data_file or DB_CONFIG["visitor_data_path"])
+        self.log_file = Path(log_file or DB_CONFIG["visit_log_path"])
+        self.lock_file = self.data_file.with_suffix('.lock')
+        self.compact_max_events = DB_CONFIG["compact_max_events"]
+        self.compact_interval = DB_CONFIG["compact_interval"]
+        self._last_compact = time.time()
+        self._snapshot_cache = (None, 0, None)
+        # 事件日誌已讀到的位置：(壓縮編號, inode, 位元組偏移, 訪問數)，每次只讀新追加的部分
+        self._log_cursor = (None, None, 0, 0)
+        self._cursor_lock = threading.Lock()
+        self._lock = threading.Lock()
+        self._ensure_data_file()
+
+    @staticmethod
+    def _empty_data() -> Dict[str, Any]:
+        return {"total_visits": 0, "daily_visits": {}, "ip_records": {}}
+
+    def _ensure_data_file(self) -> None:
+        """確保訪問數據文件存在"""
+        if not self.data_file.exists():
+            self.data_file.parent.mkdir(parents=True, exist_ok=True)
+            self._save_data(self._empty_data())
+
+    def load_data(self) -> Dict[str, Any]:
+        """載入訪問數據快照"""
+        try:
+            with open(self.data_file, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except Exception as e:
+            logger.error(f"載入訪問數據時發生錯誤：{str(e)}")
+            return self._empty_data()
+
+        # 舊版快照以 visits_by_date 記錄每日訪問量
+        for date, count in data.pop('visits_by_date', {}).items():
+            daily_visits = data.setdefault('daily_visits', {})
+            daily_visits[date] = daily_visits.get(date, 0) + count
+        for key, value in self._empty_data().items():
+            data.setdefault(key, value)
+        return data
+
+    def _save_data(self, data: Dict[str, Any]) -> bool:
+        """保存訪問數據（先寫暫存檔再替換，讀取端不會看到寫一半的檔案）"""
+        try:
+            tmp_file = self.data_file.with_suffix('.json.tmp')
+            with open(tmp_file, 'w', encoding='utf-8') as f:
+                json.dump(data, f, ensure_ascii=False, indent=2)
+            os.replace(tmp_file, self.data_file)
+            return True
+        except Exception as e:
+            logger.error(f"保存訪問數據時發生錯誤：{str(e)}")
+            return False
+
+    @contextmanager
+    def _file_lock(self, shared: bool = False) -> Iterator[None]:
+        """跨行程的檔案鎖：追加事件取共享鎖，壓縮取獨佔鎖，改名時才不會有寫到一半的事件"""
+        if fcntl is None:
+            with self._lock:
+                yield
+            return
+        with open(self.lock_file, 'a') as f:
+            fcntl.flock(f, fcntl.LOCK_SH if shared else fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(f, fcntl.LOCK_UN)
+
+    def _append_events(self, events: List[Dict[str, Any]]) -> None:
+        """追加訪問事件（每筆一行 JSON）"""
+        lines = "".join(json.dumps(event, ensure_ascii=False) + "\n" for event in events)
+        # 以附加模式一次寫入，多個行程同時寫入也不會交錯
+        with self._file_lock(shared=True):
+            with open(self.log_file, 'a', encoding='utf-8') as f:
+                f.write(lines)
+
+    def _pending_events(self) -> int:
+        """尚未併入快照的訪問數（從上次讀到的位置繼續累加各事件的 count，日誌被壓縮後重新計算）"""
+        # 其他行程壓縮後新日誌可能沿用同一個 inode，因此快照的壓縮編號改變時也要重新計算
+        compaction = self._snapshot_state()[1]
+        with self._cursor_lock:
+            try:
+                with open(self.log_file, 'rb') as f:
+                    st = os.fstat(f.fileno())
+                    last_compaction, inode, offset, visits = self._log_cursor
+                    if last_compaction != compaction or inode != st.st_ino or st.st_size < offset:
+                        offset, visits = 0, 0
+                    f.seek(offset)
+                    chunk = f.read()
+            except FileNotFoundError:
+                self._log_cursor = (compaction, None, 0, 0)
+                return 0
+            # 寫到一半的最後一行沒有換行符，留到下次讀到換行符時再計入
+            end = chunk.rfind(b"\n") + 1
+            for line in chunk[:end].splitlines():
+                try:
+                    visits += json.loads(line).get('count', 1)
+                except ValueError:
+                    continue
+            self._log_cursor = (compaction, st.st_ino, offset + end, visits)
+            return visits
+
+    def _snapshot_state(self) -> Tuple[int, Optional[str]]:
+        """快照中的總訪問量與最後一次壓縮編號（檔案未變更時不重新解析）"""
+        try:
+            mtime = self.data_file.stat().st_mtime_ns
+        except FileNotFoundError:
+            return 0, None
+        if self._snapshot_cache[0] != mtime:
+            data = self.load_data()
+            self._snapshot_cache = (mtime, data['total_visits'], data.get('last_compaction'))
+        return self._snapshot_cache[1], self._snapshot_cache[2]
+
+    def _snapshot_total(self) -> int:
+        """快照中的總訪問量"""
+        return self._snapshot_state()[0]
+
+    @staticmethod
+    def _read_events(path: Path) -> List[Dict[str, Any]]:
+        events = []
+        with open(path, 'r', encoding='utf-8') as f:
+            for line in f:
+                try:
+                    events.append(json.loads(line))
+                except ValueError:
+                    logger.warning(f"略過無法解析的訪問事件：{line.strip()}")
+        return events
+
+    def compact(self) -> int:
+        """將事件日誌併入 visitor_data.json 快照，回傳併入的事件數"""
+        with self._file_lock():
+            # 上次壓縮中斷時留下的檔案先處理，否則把目前的日誌改名後處理；
+            # 改名之後的新訪問會寫到新的日誌檔。檔名中的編號會寫入快照，
+            # 快照已寫入但檔案尚未刪除時就中斷，下次只刪除檔案而不重複計算
+            suffix = '.compacting'
+            leftover = sorted(self.log_file.parent.glob(f"{self.log_file.name}.*{suffix}"))
+            if leftover:
+                compacting = leftover[0]
+            else:
+                compacting = self.log_file.with_name(f"{self.log_file.name}.{uuid.uuid4().hex}{suffix}")
+                try:
+                    os.replace(self.log_file, compacting)
+                except FileNotFoundError:
+                    return 0
+            compaction_id = compacting.name[len(self.log_file.name) + 1:-len(suffix)]
+
+            data = self.load_data()
+            if data.get('last_compaction') == compaction_id:
+                compacting.unlink()
+                return 0
+
+            events = self._read_events(compacting)
+            ip_records = {date: set(ips) for date, ips in data['ip_records'].items()}
+            for event in events:
+                date = event['ts'][:10]
+                # 批次寫入的事件以 count 記錄多次訪問（只帶 IP 的事件 count 為 0）
+                count = event.get('count', 1)
+                data['total_visits'] += count
+                data['daily_visits'][date] = data['daily_visits'].get(date, 0) + count
+                if event.get('ip'):
+                    if event['ip'] not in ip_records.setdefault(date, set()):
+                        ip_records[date].add(event['ip'])
+                        data['ip_records'].setdefault(date, []).append(event['ip'])
+
+            data['last_compaction'] = compaction_id
+            if not self._save_data(data):
+                return 0
+            compacting.unlink()
+            self._last_compact = time.time()
+            return len(events)
+
+    def record_visit(self, ip: Optional[str] = None) -> int:
+        """每次只追加一行事件，累積到一定數量或時間才併入快照"""
+        self._append_events([{"ts": datetime.now().isoformat(timespec='seconds'), "ip": ip}])
+        pending = self._pending_events()
+        if pending >= self.compact_max_events or time.time() - self._last_compact >= self.compact_interval:
+            self.compact()
+            pending = self._pending_events()
+        return self._snapshot_total() + pending
+
+    def add_counts(self, daily_visits: Dict[str, int], ips: Dict[str, Set[str]]) -> int:
+        events = [{"ts": date, "ip": None, "count": count} for date, count in daily_visits.items()]
+        events += [{"ts": date, "ip": ip, "count": 0} for date, date_ips in ips.items() for ip in date_ips]
+        self._append_events(events)
+        # 批次寫入本來就不頻繁，直接併入快照
+        self.compact()
+        return self.total_visits()
+
+    def total_visits(self) -> int:
+        return self._snapshot_total() + self._pending_events()
+
+    def daily_report(self, date: str) -> Dict[str, Any]:
+        self.compact()
+        data = self.load_data()
+        return {
+            "total_visits": data['total_visits'],
+            "daily_visits": data['daily_visits'].get(date, 0),
+            "ips": data['ip_records'].get(date, [])
+        }
+
+
+class SqliteVisitorStore(VisitorStore):
+    """SQLite（WAL 模式）儲存：每日訪問量與不重複 IP 都是索引查詢，多個行程可同時寫入"""
+
+    SCHEMA = [
+        "CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT NOT NULL)",
+        "CREATE TABLE IF NOT EXISTS counters (name TEXT PRIMARY KEY, value INTEGER NOT NULL)",
+        "CREATE TABLE IF NOT EXISTS daily_visits (date TEXT PRIMARY KEY, visits INTEGER NOT NULL)",
+        "CREATE TABLE IF NOT EXISTS daily_ips ("
+        "date TEXT NOT NULL, ip TEXT NOT NULL, first_seen TEXT NOT NULL, PRIMARY KEY (date, ip)"
+        ") WITHOUT ROWID",
+        "CREATE INDEX IF NOT EXISTS idx_daily_ips_ip ON daily_ips (ip)",
+        "INSERT OR IGNORE INTO counters (name, value) VALUES ('total_visits', 0)"
+    ]
+
+    def __init__(self, db_path: Optional[Path] = None, json_path: Optional[Path] = None):
+        self.db_path = Path(db_path or DB_CONFIG["sqlite_path"])
+        self.json_path = Path(json_path or DB_CONFIG["visitor_data_path"])
+        self._local = threading.local()
+        self._init_db()
+
+    def _connect(self) -> sqlite3.Connection:
+        """每個執行緒各自一條連線"""
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(self.db_path, timeout=10, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    @contextmanager
+    def _transaction(self) -> Iterator[sqlite3.Connection]:
+        """寫入交易；BEGIN IMMEDIATE 先取得寫鎖，避免多個行程之間的升級死結"""
+        conn = self._connect()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            yield conn
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+        conn.execute("COMMIT")
+
+    def _init_db(self) -> None:
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        with self._transaction() as conn:
+            for statement in self.SCHEMA:
+                conn.execute(statement)
+            migrated = conn.execute("SELECT value FROM meta WHERE key = 'migrated_from_json'").fetchone()
+            if migrated is None:
+                self._migrate_json(conn)
+
+    def _migrate_json(self, conn: sqlite3.Connection) -> None:
+        """第一次使用時匯入 visitor_data.json（含尚未併入的事件日誌）"""
+        if self.json_path.exists():
+            json_store = JsonVisitorStore(self.json_path)
+            json_store.compact()
+            data = json_store.load_data()
+            conn.executemany(
+                "INSERT INTO daily_visits (date, visits) VALUES (?, ?) "
+                "ON CONFLICT(date) DO UPDATE SET visits = visits + excluded.visits",
+                data['daily_visits'].items()
+            )
+            conn.executemany(
+                "INSERT OR IGNORE INTO daily_ips (date, ip, first_seen) VALUES (?, ?, ?)",
+                [(date, ip, date) for date, ips in data['ip_records'].items() for ip in ips]
+            )
+            conn.execute("UPDATE counters SET value = value + ? WHERE name = 'total_visits'",
+                         (data['total_visits'],))
+            logger.info(f"已從 {self.json_path} 匯入 {data['total_visits']} 筆訪問統計")
+        conn.execute("INSERT INTO meta (key, value) VALUES ('migrated_from_json', ?)",
+                     (datetime.now().isoformat(timespec='seconds'),))
+
+    def record_visit(self, ip: Optional[str] = None) -> int:
+        now = datetime.now()
+        date = now.strftime('%Y-%m-%d')
+        with self._transaction() as conn:
+            conn.execute(
+                "INSERT INTO daily_visits (date, visits) VALUES (?, 1) "
+                "ON CONFLICT(date) DO UPDATE SET visits = visits + 1",
+                (date,)
+            )
+            if ip:
+                conn.execute("INSERT OR IGNORE INTO daily_ips (date, ip, first_seen) VALUES (?, ?, ?)",
+                             (date, ip, now.isoformat(timespec='seconds')))
+            return conn.execute(
+                "UPDATE counters SET value = value + 1 WHERE name = 'total_visits' RETURNING value"
+            ).fetchone()[0]
+
+    def add_counts(self, daily_visits: Dict[str, int], ips: Dict[str, Set[str]]) -> int:
+        now = datetime.now().isoformat(timespec='seconds')
+        with self._transaction() as conn:
+            conn.executemany(
+                "INSERT INTO daily_visits (date, visits) VALUES (?, ?) "
+                "ON CONFLICT(date) DO UPDATE SET visits = visits + excluded.visits",
+                daily_visits.items()
+            )
+            conn.executemany(
+                "INSERT OR IGNORE INTO daily_ips (date, ip, first_seen) VALUES (?, ?, ?)",
+                [(date, ip, now) for date, date_ips in ips.items() for ip in date_ips]
+            )
+            return conn.execute(
+                "UPDATE counters SET value = value + ? WHERE name = 'total_visits' RETURNING value",
+                (sum(daily_visits.values()),)
+            ).fetchone()[0]
+
+    def total_visits(self) -> int:
+        return self._connect().execute("SELECT value FROM counters WHERE name = 'total_visits'").fetchone()[0]
+
+    def distinct_ips(self) -> int:
+        """所有日期的不重複 IP 數"""
+        return self._connect().execute("SELECT COUNT(DISTINCT ip) FROM daily_ips").fetchone()[0]
+
+    def daily_report(self, date: str) -> Dict[str, Any]:
+        conn = self._connect()
+        row = conn.execute("SELECT visits FROM daily_visits WHERE date = ?", (date,)).fetchone()
+        ips = [ip for (ip,) in conn.execute(
+            "SELECT ip FROM daily_ips WHERE date = ? ORDER BY first_seen", (date,)
+        )]
+        return {
+            "total_visits": self.total_visits(),
+            "daily_visits": row[0] if row else 0,
+            "ips": ips
+        }
+
+
+class BufferedVisitorStore(VisitorStore):
+    """記憶體中的訪問計數器：訪問只更新計數與 IP 集合，由背景執行緒每隔一段時間
+    或累積一定次數後批次寫入後端，程式正常結束時（atexit）也會寫入"""
+
+    def __init__(self, backend: VisitorStore, flush_interval: Optional[float] = None,
+                 flush_max_visits: Optional[int] = None):
+        self.backend = backend
+        self.flush_interval = flush_interval or DB_CONFIG["flush_interval"]
+        self.flush_max_visits = flush_max_visits or DB_CONFIG["flush_max_visits"]
+        self._base_total = backend.total_visits()
+        self._pending_total = 0
+        self._daily_visits: Dict[str, int] = {}
+        self._ips: Dict[str, Set[str]] = {}
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="visitor-flush", daemon=True)
+        self._thread.start()
+        atexit.register(self.flush)
+
+    def record_visit(self, ip: Optional[str] = None) -> int:
+        date = datetime.now().strftime('%Y-%m-%d')
+        with self._lock:
+            self._pending_total += 1
+            self._daily_visits[date] = self._daily_visits.get(date, 0) + 1
+            if ip:
+                self._ips.setdefault(date, set()).add(ip)
+            total = self._base_total + self._pending_total
+            if self._pending_total >= self.flush_max_visits:
+                self._wakeup.set()
+        return total
+
+    def _run(self) -> None:
+        while True:
+            self._wakeup.wait(self.flush_interval)
+            self._wakeup.clear()
+            try:
+                self.flush()
+            except Exception as e:
+                logger.error(f"寫入訪問計數時發生錯誤：{str(e)}")
+
+    def flush(self) -> int:
+        """把累計的訪問量寫入後端，回傳寫入的訪問次數"""
+        with self._flush_lock:
+            with self._lock:
+                if not self._pending_total and not self._ips:
+                    return 0
+                daily_visits, ips, count = self._daily_visits, self._ips, self._pending_total
+                self._daily_visits, self._ips = {}, {}
+            try:
+                total = self.backend.add_counts(daily_visits, ips)
+            except Exception:
+                # 寫入失敗時放回去，下次再試
+                with self._lock:
+                    for date, visits in daily_visits.items():
+                        self._daily_visits[date] = self._daily_visits.get(date, 0) + visits
+                    for date, date_ips in ips.items():
+                        self._ips.setdefault(date, set()).update(date_ips)
+                raise
+            with self._lock:
+                # 寫入期間的新訪問仍在 _pending_total 中
+                self._pending_total -= count
+                self._base_total = total
+            return count
+
+    def total_visits(self) -> int:
+        with self._lock:
+            return self._base_total + self._pending_total
+
+    def add_counts(self, daily_visits: Dict[str, int], ips: Dict[str, Set[str]]) -> int:
+        self.flush()
+        return self.backend.add_counts(daily_visits, ips)
+
+    def daily_report(self, date: str) -> Dict[str, Any]:
+        self.flush()
+        return self.backend.daily_report(date)
+
+    def compact(self) -> int:
+        return self.flush() + self.backend.compact()
+
+
+def create_store(backend: Optional[str] = None, buffered: Optional[bool] = None) -> VisitorStore:
+    """依 DB_CONFIG["backend"] 建立儲存後端，預設再包一層記憶體計數器"""
+    backend = backend or DB_CONFIG["backend"]
+    if backend == "sqlite":
+        store = SqliteVisitorStore()
+    elif backend == "json":
+        store = JsonVisitorStore()
+    else:
+        raise ValueError(f"未知的訪問統計後端：{backend}")
+    if DB_CONFIG["buffered"] if buffered is None else buffered:
+        return BufferedVisitorStore(store)
+    return store
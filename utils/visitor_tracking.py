@@ -1,14 +1,19 @@
-import json
+import argparse
 from datetime import datetime
-import requests
-from pathlib import Path
+import ipaddress
 import smtplib
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
 import logging
-from typing import Dict, Any, Optional
+import threading
+from typing import List, Optional
+
+import streamlit as st
 
 from config import DB_CONFIG, MAIL_CONFIG
+from .geolocation import geolocator
+from .ip_enrichment import ip_enrichment
+from .visitor_store import VisitorStore, create_store
 
 # 配置日誌
 logging.basicConfig(
@@ -17,59 +22,79 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+
+def normalize_ip(value: Optional[str]) -> Optional[str]:
+    """驗證並正規化 IP 位址字串，不是合法位址時回傳 None"""
+    try:
+        return str(ipaddress.ip_address(value.strip()))
+    except (AttributeError, ValueError):
+        return None
+
+
+def get_client_ip() -> Optional[str]:
+    """從 Streamlit 的請求內容取得訪問者 IP（不做任何網路請求）"""
+    # X-Forwarded-For 最左邊的位址可由用戶端任意偽造；每個受信任的反向代理（如 Streamlit Cloud）
+    # 會在最右邊追加它看到的來源，因此從右邊數第 trusted_proxies 個才是真實來源
+    trusted_proxies = DB_CONFIG["trusted_proxies"]
+    if trusted_proxies > 0:
+        try:
+            headers = st.context.headers
+            forwarded = [hop.strip() for hop in (headers.get("X-Forwarded-For") or "").split(",") if hop.strip()]
+            if forwarded:
+                return normalize_ip(forwarded[-min(trusted_proxies, len(forwarded))])
+            real_ip = headers.get("X-Real-Ip")
+            if real_ip:
+                return normalize_ip(real_ip)
+        except Exception:
+            pass
+
+    # 直接連線時使用 websocket 連線的來源位址
+    try:
+        from streamlit.runtime import get_instance
+        from streamlit.runtime.scriptrunner import get_script_run_ctx
+
+        ctx = get_script_run_ctx()
+        client = get_instance().get_client(ctx.session_id) if ctx else None
+        remote_ip = getattr(getattr(client, "request", None), "remote_ip", None)
+        if isinstance(remote_ip, str):
+            return normalize_ip(remote_ip)
+    except Exception:
+        pass
+    return None
+
+
 class VisitorTracker:
-    def __init__(self):
-        self.data_file = DB_CONFIG["visitor_data_path"]
-        self._ensure_data_file()
+    def __init__(self, store: Optional[VisitorStore] = None):
+        self._store = store
+        self._store_lock = threading.Lock()
     
-    def _ensure_data_file(self) -> None:
-        """確保訪問數據文件存在"""
-        if not self.data_file.exists():
-            self.data_file.parent.mkdir(parents=True, exist_ok=True)
-            self._save_data({"total_visits": 0, "visits_by_date": {}})
-    
-    def _load_data(self) -> Dict[str, Any]:
-        """載入訪問數據"""
-        try:
-            with open(self.data_file, 'r', encoding='utf-8') as f:
-                return json.load(f)
-        except Exception as e:
-            logger.error(f"載入訪問數據時發生錯誤：{str(e)}")
-            return {"total_visits": 0, "visits_by_date": {}}
+    @property
+    def store(self) -> VisitorStore:
+        """第一次記錄或查詢訪問時才建立儲存後端"""
+        if self._store is None:
+            with self._store_lock:
+                if self._store is None:
+                    self._store = create_store()
+        return self._store
     
-    def _save_data(self, data: Dict[str, Any]) -> None:
-        """保存訪問數據"""
+    def compact(self) -> int:
+        """整理儲存後端中尚未併入的訪問事件"""
         try:
-            with open(self.data_file, 'w', encoding='utf-8') as f:
-                json.dump(data, f, ensure_ascii=False, indent=2)
+            return self.store.compact()
         except Exception as e:
-            logger.error(f"保存訪問數據時發生錯誤：{str(e)}")
+            logger.error(f"壓縮訪問事件時發生錯誤：{str(e)}")
+            return 0
     
     def get_visitor_ip(self) -> str:
         """獲取訪問者IP地址"""
-        try:
-            response = requests.get('https://api.ipify.org?format=json')
-            return response.json()['ip']
-        except Exception as e:
-            logger.error(f"獲取IP地址時發生錯誤：{str(e)}")
-            return '未知'
+        return get_client_ip() or '未知'
     
-    def update_visitor_count(self) -> int:
-        """更新訪問計數"""
+    def update_visitor_count(self, ip: Optional[str] = None) -> int:
+        """記錄一次訪問並回傳總訪問量；IP 資訊交給背景佇列補充"""
         try:
-            data = self._load_data()
-            today = datetime.now().strftime('%Y-%m-%d')
-            
-            # 更新總訪問量
-            data['total_visits'] += 1
-            
-            # 更新每日訪問量
-            if today not in data['visits_by_date']:
-                data['visits_by_date'][today] = 0
-            data['visits_by_date'][today] += 1
-            
-            self._save_data(data)
-            return data['total_visits']
+            ip = normalize_ip(ip) if ip else get_client_ip()
+            ip_enrichment.submit(ip)
+            return self.store.record_visit(ip)
         except Exception as e:
             logger.error(f"更新訪問計數時發生錯誤：{str(e)}")
             return 0
@@ -83,15 +108,23 @@ class VisitorTracker:
                 logger.warning("郵件配置不完整，跳過發送報告")
                 return False
                 
-            data = self._load_data()
             date = date or datetime.now().strftime('%Y-%m-%d')
-            daily_visits = data['visits_by_date'].get(date, 0)
+            report = self.store.daily_report(date)
+            # 離線對照表與快取先查，其餘 IP 整批並行向線上服務查詢
+            locations = geolocator.locate_many(report['ips'])
+            ip_details = "\n            ".join(
+                f"{ip}：{loc['city']}, {loc['country']}（{loc['org']}）"
+                for ip, loc in locations.items()
+            )
             
             email_content = f"""
             訪問統計報告 - {date}
             
-            總訪問量：{data['total_visits']}
-            今日訪問量：{daily_visits}
+            總訪問量：{report['total_visits']}
+            今日訪問量：{report['daily_visits']}
+            
+            訪問 IP 來源：
+            {ip_details}
             """
             
             msg = MIMEMultipart()
@@ -110,5 +143,18 @@ class VisitorTracker:
             logger.error(f"發送每日報告時發生錯誤：{str(e)}")
             return False
 
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="訪問統計維護")
+    parser.add_argument("--compact", action="store_true", help="將事件日誌併入快照（json 後端）")
+    args = parser.parse_args(argv)
+
+    if args.compact:
+        count = visitor_tracker.compact()
+        print(f"已併入 {count} 筆訪問事件，總訪問量 {visitor_tracker.store.total_visits()}")
+
+
 # 創建單例實例
 visitor_tracker = VisitorTracker()
+
+if __name__ == '__main__':
+    main()
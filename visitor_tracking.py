@@ -1,6 +1,5 @@
 import datetime
 import json
-import requests
 import smtplib
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
@@ -9,6 +8,9 @@ import schedule
 import threading
 import os
 
+from utils.geolocation import geolocator
+from utils.visitor_tracking import get_client_ip
+
 class VisitorTracker:
     def __init__(self, data_file='visitor_data.json'):
         self.data_file = data_file
@@ -34,11 +36,7 @@ class VisitorTracker:
             time.sleep(60)
     
     def get_visitor_ip(self):
-        try:
-            response = requests.get('https://api.ipify.org?format=json')
-            return response.json()['ip']
-        except:
-            return 'unknown'
+        return get_client_ip() or 'unknown'
     
     def load_data(self):
         try:
@@ -73,26 +71,13 @@ class VisitorTracker:
         self.save_data(data)
         return data['total_visits']
     
-    def get_ip_location(self, ip):
-        try:
-            response = requests.get(f'http://ip-api.com/json/{ip}')
-            data = response.json()
-            return {
-                'city': data.get('city', 'unknown'),
-                'country': data.get('country', 'unknown'),
-                'org': data.get('org', 'unknown')
-            }
-        except:
-            return {'city': 'unknown', 'country': 'unknown', 'org': 'unknown'}
-    
     def send_daily_report(self):
         data = self.load_data()
         today = datetime.now().strftime('%Y-%m-%d')
         
-        # 获取IP地理位置信息
+        # 获取IP地理位置信息（离线对照表、缓存，其余整批并行查询）
         ip_details = []
-        for ip in data['ip_records'].get(today, []):
-            location = self.get_ip_location(ip)
+        for ip, location in geolocator.locate_many(data['ip_records'].get(today, [])).items():
             ip_details.append(
                 f"IP: {ip}\n"
                 f"城市: {location['city']}\n"